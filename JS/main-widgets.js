@@ -4,17 +4,47 @@
  */
 
 // === INITIALIZATION ===
-document.addEventListener('DOMContentLoaded', function() {
-    console.log('Initializing ScarySingleDocs UI...');
-    initializeAll();
-    console.log('All systems initialized successfully!');
+// This script is injected into the notebook output, normally after DOMContentLoaded has
+// already fired, so wait for the widget container itself to render. Each rendered
+// container is initialized once, even if the cell is re-run.
+function whenWidgetsRendered(callback) {
+    const findPending = () => document.querySelector('.widgetContainer:not([data-initialized])');
+
+    const container = findPending();
+    if (container) {
+        callback(container);
+        return;
+    }
+
+    const observer = new MutationObserver(() => {
+        const container = findPending();
+        if (!container) return;
+        observer.disconnect();
+        callback(container);
+    });
+    observer.observe(document.body, { childList: true, subtree: true });
+}
+
+// Run non-urgent work when the browser is idle; Safari has no requestIdleCallback.
+// (A function declaration, not a const: re-running the cell re-declares it.)
+function scheduleIdle(callback) {
+    if (window.requestIdleCallback) {
+        window.requestIdleCallback(callback);
+    } else {
+        setTimeout(callback, 0);
+    }
+}
+
+whenWidgetsRendered(container => {
+    container.dataset.initialized = 'true';
+    scheduleIdle(() => {
+        console.log('Initializing ScarySingleDocs UI...');
+        initializeAll();
+        console.log('All systems initialized successfully!');
+    });
 });
 
 function initializeAll() {
-    initializeTopTabs();
-    initializeModelItems();
-    initializeDrawer();
-    initializeBottomTabs();
     initializeEmpowerment();
     initializeUtilityButtons();
 }
@@ -22,87 +52,106 @@ function initializeAll() {
 // === UI COMPONENT INITIALIZERS ===
 
 // 1. Top-level download tabs (Models, VAE, etc.)
+// Delegated from the document, so it works for widgets rendered after this script
+// and needs no DOMContentLoaded; installed once even if the cell is re-run.
 function initializeTopTabs() {
-    const tabButtons = document.querySelectorAll('.tab-button');
-    const tabContents = document.querySelectorAll('.tab-content');
-    
-    tabButtons.forEach(button => {
-        button.addEventListener('click', function() {
-            const targetTab = this.dataset.tab;
-            
-            // Deactivate all
-            tabButtons.forEach(btn => btn.classList.remove('active'));
-            tabContents.forEach(content => content.classList.remove('active'));
-            
-            // Activate clicked
-            this.classList.add('active');
-            const targetContent = document.getElementById(targetTab + '-content');
-            if (targetContent) {
-                targetContent.classList.add('active');
-            }
-        });
+    if (window.__scaryTopTabsInstalled) return;
+    window.__scaryTopTabsInstalled = true;
+
+    document.addEventListener('click', function(event) {
+        const button = event.target.closest('.tab-button');
+        if (!button) return;
+        const container = button.closest('.download-tabs-container');
+        if (!container) return;
+
+        const tabIndex = Array.prototype.indexOf.call(button.parentElement.children, button);
+        const targetContent = container.querySelectorAll('.tab-content')[tabIndex];
+
+        // Deactivate all
+        container.querySelectorAll('.tab-button.active, .tab-content.active')
+            .forEach(el => el.classList.remove('active'));
+
+        // Activate clicked
+        button.classList.add('active');
+        if (!targetContent) return;
+        targetContent.classList.add('active');
+
+        // Tabs are built by Python the first time they are opened; the flag is set once
+        // per tab, so later clicks skip both the DOM lookup and the kernel call
+        if (targetContent.dataset.requested) return;
+        targetContent.dataset.requested = 'true';
+        if (!targetContent.querySelector('.model-item') &&
+            typeof google !== 'undefined' && google.colab && google.colab.kernel) {
+            google.colab.kernel.invokeFunction('notebook.open_toggle_tab', [tabIndex], {});
+        }
     });
 }
+initializeTopTabs();
 
 // 2. Selectable model items
+// Active state lives in the DOM only; Python reads it back when saving.
 function initializeModelItems() {
-    const modelItems = document.querySelectorAll('.model-item');
-    modelItems.forEach(item => {
-        item.addEventListener('click', function() {
-            this.classList.toggle('active');
-        });
+    if (window.__scaryModelItemsInstalled) return;
+    window.__scaryModelItemsInstalled = true;
+
+    document.addEventListener('click', function(event) {
+        const item = event.target.closest('.model-item');
+        if (item) item.classList.toggle('active');
     });
 }
+initializeModelItems();
 
-// 3. Advanced Options Drawer
-function initializeDrawer() {
-    const drawerToggle = document.getElementById('drawer-toggle');
-    const drawerSections = document.getElementById('drawer-sections');
-    if (!drawerToggle || !drawerSections) return;
-
-    let isOpen = false;
-
-    drawerToggle.addEventListener('click', function() {
-        isOpen = !isOpen;
-        
-        if (isOpen) {
-            drawerSections.classList.remove('hidden');
-            drawerSections.classList.add('shown');
-            drawerToggle.classList.add('expanded');
-            drawerToggle.querySelector('.drawer-toggle-text').textContent = 'Hide Advanced Options';
-        } else {
-            drawerSections.classList.remove('shown');
-            drawerSections.classList.add('hidden');
-            drawerToggle.classList.remove('expanded');
-            drawerToggle.querySelector('.drawer-toggle-text').textContent = 'Advanced Options';
+// Close the widgets from Python as soon as the save fade-out (.mainContainer.hide) has played
+function initializeCloseOnFade() {
+    if (window.__scaryCloseOnFadeInstalled) return;
+    window.__scaryCloseOnFadeInstalled = true;
+
+    document.addEventListener('animationend', function(event) {
+        const target = event.target;
+        if (!target.classList.contains('mainContainer') || !target.classList.contains('hide')) return;
+        if (typeof google !== 'undefined' && google.colab && google.colab.kernel) {
+            google.colab.kernel.invokeFunction('notebook.close_widgets', [], {});
         }
     });
 }
+initializeCloseOnFade();
 
-// 4. Tabs within the Advanced Drawer (Custom Download, etc.)
-function initializeBottomTabs() {
-    const bottomTabButtons = document.querySelectorAll('.bottom-tab-button');
-    const bottomTabContents = document.querySelectorAll('.bottom-tab-content');
-    if (bottomTabButtons.length === 0) return;
-
-    bottomTabButtons.forEach(button => {
-        button.addEventListener('click', function() {
-            const targetTab = this.dataset.bottomTab;
-            
-            // Deactivate all
-            bottomTabButtons.forEach(btn => btn.classList.remove('active'));
-            bottomTabContents.forEach(content => content.classList.remove('active'));
-            
-            // Activate clicked
-            this.classList.add('active');
-            const targetContent = document.getElementById(targetTab + '-content');
-            if (targetContent) {
-                targetContent.classList.add('active');
-            }
+// Active item indices of every download tab, in tab order
+function collectToggleStates(root = document) {
+    const container = root.querySelector('.download-tabs-container');
+    if (!container) return [];
+
+    return Array.from(container.querySelectorAll('.tab-content'), content => {
+        const active = [];
+        content.querySelectorAll('.model-item').forEach((item, i) => {
+            if (item.classList.contains('active')) active.push(i);
         });
+        return active;
     });
 }
 
+// Save button: delegated, so it works even if the button renders after initialization,
+// and reads the toggle states of the container the clicked button belongs to
+function initializeSaveButton() {
+    if (window.__scarySaveButtonInstalled) return;
+    window.__scarySaveButtonInstalled = true;
+
+    document.addEventListener('click', function(event) {
+        const button = event.target.closest('.button_save');
+        if (!button) return;
+        if (typeof google !== 'undefined' && google.colab && google.colab.kernel) {
+            const root = button.closest('.widgetContainer') || document;
+            google.colab.kernel.invokeFunction('notebook.save_data_from_js', [collectToggleStates(root)], {});
+        }
+    });
+}
+initializeSaveButton();
+
+// 3. Advanced Options Drawer is toggled in Python (toggle_drawer), which also builds
+//    its sections on first expand
+// 4. Tabs within the Advanced Drawer are switched in Python (switch_bottom_tab),
+//    which also builds the Advanced Settings tab on first open
+
 // 5. Empowerment (Text Area vs. Individual Fields) Toggle
 function initializeEmpowerment() {
     const empowermentToggle = document.getElementById('empowerment');
@@ -129,15 +178,6 @@ function initializeUtilityButtons() {
     const exportButton = document.querySelector('.utility-button[title="Export"]');
     const importButton = document.querySelector('.utility-button[title="Import"]');
 
-    const saveButton = document.querySelector('.button_save');
-    if (saveButton) {
-        saveButton.addEventListener('click', () => {
-            if (typeof google !== 'undefined' && google.colab && google.colab.kernel) {
-                google.colab.kernel.invokeFunction('notebook.save_data_from_js', [], {});
-            }
-        });
-    }
-
     if (importButton) {
         importButton.addEventListener('click', () => {
             if (typeof google !== 'undefined' && google.colab && google.colab.kernel) {
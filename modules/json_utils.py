@@ -119,12 +119,11 @@ def _read_json(filepath: Union[str, Path]) -> Dict[str, Any]:
         filepath: Path to JSON file (str or Path object)
     """
     try:
-        if not os.path.exists(filepath):
-            return {}
-
         with open(filepath, 'r') as f:
             content = f.read()
             return json.loads(content) if content.strip() else {}
+    except FileNotFoundError:    # one open instead of exists() + open
+        return {}
     except Exception as e:
         logger.error(f"Read error ({filepath}): {str(e)}")
         return {}
@@ -137,8 +136,12 @@ def _write_json(filepath: Union[str, Path], data: Dict[str, Any]):
         filepath: Destination path (str or Path object)
     """
     try:
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        with open(filepath, 'w') as f:
+        try:
+            f = open(filepath, 'w')
+        except FileNotFoundError:    # create the directory only when it is missing
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            f = open(filepath, 'w')
+        with f:
             json.dump(data, f, indent=4, ensure_ascii=False)
     except Exception as e:
         logger.error(f"Write error ({filepath}): {str(e)}")
@@ -194,6 +197,24 @@ def save(*args):
     _set_nested_value(data, keys, value)
     _write_json(filepath, data)
 
+@validate_args(2, 2)
+def save_many(*args):
+    """
+    Save several values in one read-modify-write, creating full paths
+
+    Args:
+        filepath (str): JSON file path
+        values (dict): Dot-separated target path -> value to store
+    """
+    filepath, values = args[0], args[1]
+
+    data = _read_json(filepath)
+    for key, value in values.items():
+        keys = parse_key(key)
+        if keys:
+            _set_nested_value(data, keys, value)
+    _write_json(filepath, data)
+
 @validate_args(3, 3)
 def update(*args):
     """
@@ -2,6 +2,7 @@
 
 import json_utils as js
 
+from typing import Optional
 from pathlib import Path
 import json
 import os
@@ -12,13 +13,11 @@ osENV = os.environ
 
 # ======================== CONSTANTS =======================
 
-# Constants (auto-convert env vars to Path)
-PATHS = {k: Path(v) for k, v in osENV.items() if k.endswith('_path')}   # k -> key; v -> value
-
-HOME = PATHS['home_path']
-VENV = PATHS['venv_path']
-SCR_PATH = PATHS['scr_path']
-SETTINGS_PATH = PATHS['settings_path']
+# Constants (env vars -> Path)
+HOME = Path(osENV['home_path'])
+VENV = Path(osENV['venv_path'])
+SCR_PATH = Path(osENV['scr_path'])
+SETTINGS_PATH = Path(osENV['settings_path'])
 
 DEFAULT_UI = 'A1111'
 WEBUI_PATHS = {
@@ -39,21 +38,26 @@ WEBUI_PATHS = {
 
 # ===================== WEBUI HANDLERS =====================
 
-def update_current_webui(current_value: str) -> None:
-    """Update the current WebUI value and save settings."""
-    current_stored = js.read(SETTINGS_PATH, 'WEBUI.current')
-    latest_value = js.read(SETTINGS_PATH, 'WEBUI.latest', None)
+def update_current_webui(current_value: str, settings: Optional[dict] = None) -> None:
+    """
+    Update the current WebUI value and save settings.
+    All keys are written in a single pass, together with any extra dot-key `settings`.
+    """
+    webui = js.read(SETTINGS_PATH, 'WEBUI', None) or {}
+    current_stored = webui.get('current')
+    values = dict(settings or {})
 
-    if latest_value is None or current_stored != current_value:
-        js.save(SETTINGS_PATH, 'WEBUI.latest', current_stored)
-        js.save(SETTINGS_PATH, 'WEBUI.current', current_value)
+    if webui.get('latest') is None or current_stored != current_value:
+        values['WEBUI.latest'] = current_stored
+        values['WEBUI.current'] = current_value
 
-    js.save(SETTINGS_PATH, 'WEBUI.webui_path', str(HOME / current_value))
-    _set_webui_paths(current_value)
+    values['WEBUI.webui_path'] = str(HOME / current_value)
+    values.update({f"WEBUI.{key}": path for key, path in _webui_paths(current_value).items()})
+    js.save_many(SETTINGS_PATH, values)
 
 
-def _set_webui_paths(ui: str) -> None:
-    """Configure paths for specified UI, fallback to A1111 for unknown UIs."""
+def _webui_paths(ui: str) -> dict:
+    """Build the path settings for specified UI, fallback to A1111 for unknown UIs."""
     selected_ui = ui if ui in WEBUI_PATHS else DEFAULT_UI
     webui_root = HOME / ui
     models_root = webui_root / 'models'
@@ -87,8 +91,7 @@ def _set_webui_paths(ui: str) -> None:
         'encoder_dir': str(models_root / ('text_encoders' if is_comfy else 'text_encoder')),
         'diffusion_dir': str(models_root / 'diffusion_models')
     }
-
-    js.update(SETTINGS_PATH, 'WEBUI', path_config)
+    return path_config
 
 
 def handle_setup_timer(webui_path: str, timer_webui: float) -> float:
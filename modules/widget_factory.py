@@ -6,6 +6,8 @@ import time
 
 
 class WidgetFactory:
+    HEADER_TEMPLATE = '<div class="{classes}">{name}</div>'
+
     # INIT
     def __init__(self):
         self.default_style = {'description_width': 'initial'}
@@ -31,6 +33,14 @@ class WidgetFactory:
         for cls in classes:
             widget.add_class(cls)
 
+    def set_classes(self, widget, add=None, remove=None):
+        """Add and remove CSS classes of a widget, sent to the frontend as one sync message."""
+        with widget.hold_sync():
+            for cls in self._validate_class_names(remove):
+                widget.remove_class(cls)
+            for cls in self._validate_class_names(add):
+                widget.add_class(cls)
+
     # HTML
     def load_css(self, css_path):
         """Load CSS from a file and display it in the notebook."""
@@ -60,8 +70,7 @@ class WidgetFactory:
     def create_header(self, name, class_names=None):
         """Create a header HTML widget."""
         class_names_str = ' '.join(class_names) if class_names else 'header'
-        header = f'<div class="{class_names_str}">{name}</div>'
-        return self.create_html(header)
+        return self.create_html(self.HEADER_TEMPLATE.format(classes=class_names_str, name=name))
 
     # Widgets
     ## Supporting functions
@@ -247,4 +256,29 @@ class WidgetFactory:
 
         for widget, property_name in widget_pairs:
             for callback in callbacks:
-                widget.observe(lambda change, widget=widget, callback=callback: callback(change, widget), names=property_name)
\ No newline at end of file
+                widget.observe(lambda change, widget=widget, callback=callback: callback(change, widget), names=property_name)
+
+    def connect_many(self, bindings):
+        """
+        Connect several widgets, each to its own callback, in one call.
+
+        Parameters:
+        - bindings: Iterable of (widget, property_name, callback) tuples; callbacks get (change, widget).
+        """
+        for widget, property_name, callback in bindings:
+            self.connect_widgets([(widget, property_name)], callback)
+
+    def connect_buttons(self, buttons, callbacks):
+        """
+        Register the same click callback(s) on several buttons at once.
+
+        Parameters:
+        - buttons: List of buttons.
+        - callbacks: List of callback functions or a single callback function, called with the clicked button.
+        """
+        if not isinstance(callbacks, list):
+            callbacks = [callbacks]
+
+        for button in buttons:
+            for callback in callbacks:
+                button.on_click(callback)
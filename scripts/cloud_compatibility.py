@@ -23,20 +23,307 @@ Features:
 - Fallback mechanisms
 """
 
+from __future__ import annotations
+
 import os
 import platform
 import sys
 import json
-import time
-from typing import Dict, Any, List, Optional, Tuple, Union
-from dataclasses import dataclass, field
-from pathlib import Path
-import ipywidgets as widgets
-from IPython.display import display, HTML, Javascript
-import subprocess
-import socket
-import psutil
-import requests
+import re
+import string
+import functools
+import io
+import operator
+import types
+from typing import Dict, Any, List, Mapping, Optional, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, replace
+
+# requests / subprocess / ipywidgets / IPython are imported at point of use to keep module import cheap
+if TYPE_CHECKING:
+    import ipywidgets as widgets
+
+
+def _read_proc_version() -> str:
+    """Read kernel version info (lowercased), empty string if unavailable"""
+    try:
+        with open('/proc/version', 'r') as f:
+            return f.read().lower()
+    except OSError:
+        return ''
+
+
+# Host facts that never change during the process lifetime
+_PROC_VERSION = _read_proc_version()
+_HOSTNAME = platform.node().lower()
+
+
+# Ordered (token, provider) pairs; first match wins
+_HOSTNAME_PROVIDER_TOKENS = (
+    ('aws', "AWS"), ('ec2', "AWS"), ('amazon', "AWS"),
+    ('gcp', "Google Cloud"), ('google', "Google Cloud"), ('compute', "Google Cloud"),
+    ('azure', "Microsoft Azure"), ('microsoft', "Microsoft Azure"),
+    ('digital', "DigitalOcean"), ('ocean', "DigitalOcean")
+)
+
+_KERNEL_PROVIDER_TOKENS = (
+    ('aws', "AWS"),
+    ('gcp', "Google Cloud"), ('google', "Google Cloud"),
+    ('azure', "Microsoft Azure")
+)
+
+
+def _match_provider(text: str, tokens: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """Return the provider of the first token found in text"""
+    for token, provider in tokens:
+        if token in text:
+            return provider
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_network() -> bool:
+    """Check outbound connectivity once per process"""
+    try:
+        import requests
+    except ImportError:
+        return False
+    try:
+        response = requests.head('https://www.google.com/generate_204', timeout=2)
+        return response.status_code in (200, 204)
+    except requests.RequestException:
+        return False
+
+
+@functools.cache
+def _query_gpu_memory_gb() -> Optional[float]:
+    """Total memory of the first GPU in GB, or None if no GPU is visible"""
+    try:
+        import pynvml
+        pynvml.nvmlInit()
+        handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+        return pynvml.nvmlDeviceGetMemoryInfo(handle).total / (1024**3)
+    except Exception:    # pynvml missing, or NVML failed (e.g. driver/library mismatch)
+        pass
+    
+    # Fallback to nvidia-smi when pynvml is unavailable or fails
+    try:
+        import subprocess
+        result = subprocess.run(['nvidia-smi', '--query-gpu=memory.total', '--format=csv,noheader,nounits'],
+                                capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            return int(result.stdout.strip().splitlines()[0]) / 1024
+    except:
+        pass
+    return None
+
+
+# Numeric tunnel priorities (lower sorts first) and their display labels
+PRIORITY_HIGH, PRIORITY_MEDIUM, PRIORITY_LOW = 0, 1, 2
+_PRIORITY_LABELS = ('high', 'medium', 'low')
+_PRIORITY_COLORS = ("#46FF46", "#FFA500", "#FF4444")  # indexed like _PRIORITY_LABELS
+
+# Display-cased labels for the tunnel cards
+_PRIORITY_DISPLAY = ('HIGH', 'MEDIUM', 'LOW')  # indexed like _PRIORITY_LABELS
+_DIFFICULTY_DISPLAY = {'easy': 'Easy', 'medium': 'Medium', 'hard': 'Hard'}
+_FREE_TIER_DISPLAY = {'yes': 'Yes', 'no': 'No', 'limited': 'Limited'}
+
+@dataclass(slots=True, frozen=True)
+class TunnelRecommendation:
+    """Tunnel service recommendation"""
+    name: str
+    description: str
+    priority: int
+    setup_difficulty: str
+    free_tier: str
+
+
+_TUNNEL_CONFIGS = {
+    'ngrok': TunnelRecommendation(
+        name='ngrok',
+        description='Secure tunnels with HTTPS',
+        priority=PRIORITY_HIGH,
+        setup_difficulty='easy',
+        free_tier='yes'
+    ),
+    'cloudflared': TunnelRecommendation(
+        name='Cloudflare Tunnel',
+        description='Fast and reliable tunneling',
+        priority=PRIORITY_HIGH,
+        setup_difficulty='medium',
+        free_tier='yes'
+    ),
+    'localtunnel': TunnelRecommendation(
+        name='LocalTunnel',
+        description='Simple local tunnel solution',
+        priority=PRIORITY_MEDIUM,
+        setup_difficulty='easy',
+        free_tier='yes'
+    ),
+    'gradio': TunnelRecommendation(
+        name='Gradio Share',
+        description='Built-in sharing for ML demos',
+        priority=PRIORITY_MEDIUM,
+        setup_difficulty='easy',
+        free_tier='yes'
+    )
+}
+
+# Platform-specific priority adjustments
+_TUNNEL_PRIORITY_OVERRIDES = {
+    'kaggle': {'cloudflared': PRIORITY_LOW, 'localtunnel': PRIORITY_LOW, 'gradio': PRIORITY_LOW},  # Kaggle works best with ngrok
+    'google_colab': {'ngrok': PRIORITY_HIGH, 'cloudflared': PRIORITY_HIGH}                      # Colab works well with these
+}
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TAG_GAP_RE = re.compile(r'>\s+<')
+
+
+def _minify_markup(markup: str) -> str:
+    """Collapse whitespace in static HTML/CSS (not safe for JS with // comments)"""
+    return _TAG_GAP_RE.sub('><', _WHITESPACE_RE.sub(' ', markup)).strip()
+
+
+_BADGE_TEMPLATE = _minify_markup("""
+                <span style="background: #DC143C; color: white; padding: 4px 8px; 
+                            border-radius: 12px; font-size: 11px; font-weight: 600;">
+                    {text}
+                </span>
+            """)
+
+_NO_OPTIMIZATIONS_HTML = '<span style="color: #666; font-style: italic;">No specific optimizations applied</span>'
+
+# HTML templates for the dashboard widgets, filled with str.format_map
+_REPORT_TEMPLATE = _minify_markup("""
+<div style="background: linear-gradient(135deg, rgba(139,0,0,0.1), rgba(220,20,60,0.05)); 
+            border: 2px solid #DC143C; border-radius: 12px; padding: 20px; margin: 16px 0;">
+    <h3 style="color: #8B0000; margin: 0 0 16px 0; font-family: 'Cinzel', serif;">
+        🌐 Cloud Environment Report
+    </h3>
+    
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 16px; margin-bottom: 16px;">
+        <div>
+            <h4 style="color: #DC143C; margin: 0 0 8px 0;">Environment</h4>
+            <p style="margin: 4px 0; color: #333;">Platform: <strong>{platform}</strong></p>
+            <p style="margin: 4px 0; color: #333;">Provider: <strong>{provider}</strong></p>
+            <p style="margin: 4px 0; color: #333;">Region: <strong>{region}</strong></p>
+        </div>
+        
+        <div>
+            <h4 style="color: #DC143C; margin: 0 0 8px 0;">Resources</h4>
+            <p style="margin: 4px 0; color: #333;">Memory: <strong>{memory:.1f} GB</strong></p>
+            <p style="margin: 4px 0; color: #333;">CPU Cores: <strong>{cores}</strong></p>
+            <p style="margin: 4px 0; color: #333;">GPU: <strong>{gpu}</strong>
+            {gpu_memory}</p>
+        </div>
+        
+        <div>
+            <h4 style="color: #DC143C; margin: 0 0 8px 0;">Network</h4>
+            <p style="margin: 4px 0; color: #333;">Internet: <strong>{internet}</strong></p>
+            <p style="margin: 4px 0; color: #333;">Custom Domains: <strong>{custom_domains}</strong></p>
+            <p style="margin: 4px 0; color: #333;">Tunnels: <strong>{tunnels} supported</strong></p>
+        </div>
+    </div>
+    
+    <div style="border-top: 1px solid rgba(220,20,60,0.3); padding-top: 16px;">
+        <h4 style="color: #DC143C; margin: 0 0 8px 0;">Active Optimizations</h4>
+        <div style="display: flex; flex-wrap: wrap; gap: 8px;">
+            {badges}
+        </div>
+    </div>
+</div>
+""")
+
+_TEST_ITEM_TEMPLATE = _minify_markup("""
+<div style="display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid rgba(220,20,60,0.1);">
+    <span style="color: #333;">{label}</span>
+    <span style="color: {color}; font-weight: bold;">{status} {result}</span>
+</div>
+""")
+
+_TEST_RESULTS_TEMPLATE = _minify_markup("""
+<div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
+    <h4 style="color: #8B0000; margin: 0 0 16px 0;">🧪 Compatibility Test Results</h4>
+    {items}
+    <div style="margin-top: 16px; padding: 12px; background: rgba(220,20,60,0.1); border-radius: 6px; text-align: center;">
+        <strong style="color: {score_color};">Performance Score: {score}/100</strong>
+    </div>
+</div>
+""")
+
+_TUNNEL_ITEM_TEMPLATE = string.Template(_minify_markup("""
+<div style="border: 1px solid rgba(220,20,60,0.2); border-radius: 6px; padding: 12px; margin: 8px 0;">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
+        <h5 style="color: #8B0000; margin: 0;">${name}</h5>
+        <span style="background: ${priority_color}; color: white; padding: 2px 8px; border-radius: 10px; font-size: 10px;">
+            ${priority}
+        </span>
+    </div>
+    <p style="color: #333; margin: 4px 0; font-size: 13px;">${description}</p>
+    <div style="display: flex; justify-content: space-between; font-size: 11px; color: #666;">
+        <span>Setup: ${setup_difficulty}</span>
+        <span>Free Tier: ${free_tier}</span>
+    </div>
+</div>
+"""))
+
+_DASHBOARD_HEADER_HTML = _minify_markup("""
+<div class="cloud-optimized-container">
+    <h2 style="color: #8B0000; text-align: center; font-family: 'Cinzel', serif; margin-bottom: 24px;">
+        🚀 Enhanced Widget System - Cloud Compatibility Dashboard
+    </h2>
+</div>
+""")
+
+_EMPTY_TUNNEL_HTML = _minify_markup("""
+<div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
+    <h4 style="color: #8B0000; margin: 0 0 16px 0;">🌐 Tunnel Recommendations</h4>
+    <p style="color: #666; font-style: italic;">No tunnel services recommended for this environment.</p>
+</div>
+""")
+
+_METRIC_CARD_STYLE = "text-align:center;padding:12px;background:rgba(220,20,60,0.1);border-radius:6px;"
+
+# Filled with %: widget count, load time (s), memory usage (MB)
+_METRICS_TEMPLATE = _minify_markup(f"""
+<div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
+    <h4 style="color: #8B0000; margin: 0 0 16px 0;">📊 Performance Metrics</h4>
+    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 12px;">
+        <div style="{_METRIC_CARD_STYLE}">
+            <div style="font-size: 24px; font-weight: bold; color: #8B0000;">%d</div>
+            <div style="font-size: 12px; color: #666;">Active Widgets</div>
+        </div>
+        <div style="{_METRIC_CARD_STYLE}">
+            <div style="font-size: 24px; font-weight: bold; color: #8B0000;">%.2fs</div>
+            <div style="font-size: 12px; color: #666;">Load Time</div>
+        </div>
+        <div style="{_METRIC_CARD_STYLE}">
+            <div style="font-size: 24px; font-weight: bold; color: #8B0000;">%.1fMB</div>
+            <div style="font-size: 12px; color: #666;">Memory Usage</div>
+        </div>
+    </div>
+</div>
+""")
+
+_TUNNEL_LIST_TEMPLATE = _minify_markup("""
+<div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
+    <h4 style="color: #8B0000; margin: 0 0 16px 0;">🌐 Recommended Tunnel Services</h4>
+    {items}
+</div>
+""")
+_TUNNEL_LIST_HEAD, _, _TUNNEL_LIST_TAIL = _TUNNEL_LIST_TEMPLATE.partition('{items}')
+
+
+@functools.lru_cache(maxsize=64)
+def _render_tunnel_card(tunnel: TunnelRecommendation) -> str:
+    """Render a tunnel card; memoized since the tunnel catalogue is small and fixed"""
+    return _TUNNEL_ITEM_TEMPLATE.substitute(
+        name=tunnel.name,
+        priority_color=_PRIORITY_COLORS[tunnel.priority],
+        priority=_PRIORITY_DISPLAY[tunnel.priority],
+        description=tunnel.description,
+        setup_difficulty=_DIFFICULTY_DISPLAY[tunnel.setup_difficulty],
+        free_tier=_FREE_TIER_DISPLAY[tunnel.free_tier]
+    )
 
 
 @dataclass
@@ -81,7 +368,13 @@ class CloudCompatibilityManager:
     
     def __init__(self):
         self.environment = self._detect_environment()
-        self.adaptations = []
+        self._tunnel_recommendations = None
+        self._badges_html = None
+        
+        # Dashboard widgets are reused across refreshes; created on first render
+        self._tunnel_widget = None
+        self._metrics_widget = None
+        self._metrics_dirty = True
         self.performance_metrics = {
             'load_time': 0.0,
             'memory_usage': 0.0,
@@ -90,7 +383,11 @@ class CloudCompatibilityManager:
         }
         
         # Apply environment-specific optimizations
-        self._apply_optimizations()
+        self._apply_environment_tweaks()
+        
+        # Layout depends only on the (now final) environment, so build it once
+        self._layout_config_data = self._build_layout_config()
+        self._layout_config = types.MappingProxyType(self._layout_config_data)
     
     def _detect_environment(self) -> CloudEnvironment:
         """Detect current cloud environment and its capabilities"""
@@ -167,7 +464,7 @@ class CloudCompatibilityManager:
             
         # Generic cloud detection
         else:
-            env = self._detect_generic_cloud()
+            env = self._detect_generic_cloud(env)
         
         # Get actual system resources
         env = self._update_system_resources(env)
@@ -176,85 +473,72 @@ class CloudCompatibilityManager:
     
     def _is_google_colab(self) -> bool:
         """Check if running in Google Colab"""
-        return any([
-            'COLAB_GPU' in os.environ,
-            'COLAB_TPU_ADDR' in os.environ,
-            '/usr/local/lib/python' in sys.path[0] and 'colab' in sys.path[0].lower(),
-            os.path.exists('/content')
-        ])
+        return (
+            'COLAB_GPU' in os.environ
+            or 'COLAB_TPU_ADDR' in os.environ
+            or ('/usr/local/lib/python' in sys.path[0] and 'colab' in sys.path[0].lower())
+            or os.path.exists('/content')
+        )
     
     def _is_kaggle(self) -> bool:
         """Check if running in Kaggle"""
-        return any([
-            'KAGGLE_URL_BASE' in os.environ,
-            'KAGGLE_USER_SECRETS_TOKEN' in os.environ,
-            os.path.exists('/kaggle')
-        ])
+        return (
+            'KAGGLE_URL_BASE' in os.environ
+            or 'KAGGLE_USER_SECRETS_TOKEN' in os.environ
+            or os.path.exists('/kaggle')
+        )
     
     def _is_lightning_ai(self) -> bool:
         """Check if running in Lightning.ai"""
-        return any([
-            'LIGHTNING_CLOUD_URL' in os.environ,
-            'LIGHTNING_APP_NAME' in os.environ,
-            os.path.exists('/teamspace')
-        ])
+        return (
+            'LIGHTNING_CLOUD_URL' in os.environ
+            or 'LIGHTNING_APP_NAME' in os.environ
+            or os.path.exists('/teamspace')
+        )
     
     def _is_paperspace(self) -> bool:
         """Check if running in Paperspace"""
-        return any([
-            'PAPERSPACE_NOTEBOOK_REPO_ID' in os.environ,
-            'PS_API_KEY' in os.environ,
-            os.path.exists('/notebooks')
-        ])
+        return (
+            'PAPERSPACE_NOTEBOOK_REPO_ID' in os.environ
+            or 'PS_API_KEY' in os.environ
+            or os.path.exists('/notebooks')
+        )
     
     def _is_vast_ai(self) -> bool:
         """Check if running in Vast.ai"""
-        return any([
-            'VAST_CONTAINERLABEL' in os.environ,
-            'SSH_CONNECTION' in os.environ and 'vast' in platform.node().lower(),
-            os.path.exists('/root') and 'vast' in platform.node().lower()
-        ])
+        return (
+            'VAST_CONTAINERLABEL' in os.environ
+            or ('vast' in _HOSTNAME
+                and ('SSH_CONNECTION' in os.environ or os.path.exists('/root')))
+        )
     
     def _is_aws_sagemaker(self) -> bool:
         """Check if running in AWS SageMaker"""
-        return any([
-            'SM_TRAINING_ENV' in os.environ,
-            'SAGEMAKER_PROGRAM' in os.environ,
-            os.path.exists('/opt/ml')
-        ])
+        return (
+            'SM_TRAINING_ENV' in os.environ
+            or 'SAGEMAKER_PROGRAM' in os.environ
+            or os.path.exists('/opt/ml')
+        )
     
     def _is_azure_ml(self) -> bool:
         """Check if running in Azure ML"""
-        return any([
-            'AZUREML_RUN_ID' in os.environ,
-            'AML_PARAMETER_job_name' in os.environ,
-            os.path.exists('/mnt/azureml')
-        ])
+        return (
+            'AZUREML_RUN_ID' in os.environ
+            or 'AML_PARAMETER_job_name' in os.environ
+            or os.path.exists('/mnt/azureml')
+        )
     
-    def _detect_generic_cloud(self) -> CloudEnvironment:
+    def _detect_generic_cloud(self, env: CloudEnvironment) -> CloudEnvironment:
         """Detect generic cloud environment"""
-        env = CloudEnvironment(platform="generic_cloud", provider="Unknown")
+        env.platform = "generic_cloud"
+        env.provider = "Unknown"
         
-        # Check common cloud indicators
-        hostname = platform.node().lower()
-        if any(cloud in hostname for cloud in ['aws', 'ec2', 'amazon']):
-            env.provider = "AWS"
-        elif any(cloud in hostname for cloud in ['gcp', 'google', 'compute']):
-            env.provider = "Google Cloud"
-        elif any(cloud in hostname for cloud in ['azure', 'microsoft']):
-            env.provider = "Microsoft Azure"
-        elif any(cloud in hostname for cloud in ['digital', 'ocean']):
-            env.provider = "DigitalOcean"
-        elif os.path.exists('/proc/version'):
-            # Check for cloud-specific kernel info
-            with open('/proc/version', 'r') as f:
-                version_info = f.read().lower()
-                if 'aws' in version_info:
-                    env.provider = "AWS"
-                elif 'gcp' in version_info or 'google' in version_info:
-                    env.provider = "Google Cloud"
-                elif 'azure' in version_info:
-                    env.provider = "Microsoft Azure"
+        # Check common cloud indicators, falling back to kernel info
+        provider = _match_provider(_HOSTNAME, _HOSTNAME_PROVIDER_TOKENS)
+        if provider is None and _PROC_VERSION:
+            provider = _match_provider(_PROC_VERSION, _KERNEL_PROVIDER_TOKENS)
+        if provider is not None:
+            env.provider = provider
         
         # Default tunnel support for generic cloud
         env.tunnel_support = ["ngrok", "cloudflared", "localtunnel", "gradio"]
@@ -264,392 +548,160 @@ class CloudCompatibilityManager:
     def _update_system_resources(self, env: CloudEnvironment) -> CloudEnvironment:
         """Update environment with actual system resources"""
         try:
+            if hasattr(os, 'sysconf') and hasattr(os, 'statvfs'):
+                # POSIX: single syscalls, no psutil import needed
+                total_memory = os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+                stat = os.statvfs('/')
+                total_disk = stat.f_blocks * stat.f_frsize
+            else:
+                import psutil
+                total_memory = psutil.virtual_memory().total
+                total_disk = psutil.disk_usage('/').total
+            
             # Memory
-            memory_info = psutil.virtual_memory()
-            env.max_memory_gb = memory_info.total / (1024**3)
+            env.max_memory_gb = total_memory / (1024**3)
             
             # CPU
-            env.cpu_cores = psutil.cpu_count()
+            env.cpu_cores = os.cpu_count() or 1
             
             # GPU detection
-            try:
-                import subprocess
-                result = subprocess.run(['nvidia-smi', '--query-gpu=memory.total', '--format=csv,noheader,nounits'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    gpu_memory = int(result.stdout.strip())
-                    env.gpu_available = True
-                    env.gpu_memory_gb = gpu_memory / 1024
-            except:
-                pass
+            gpu_memory_gb = _query_gpu_memory_gb()
+            if gpu_memory_gb is not None:
+                env.gpu_available = True
+                env.gpu_memory_gb = gpu_memory_gb
             
             # Disk space
-            disk_info = psutil.disk_usage('/')
-            env.max_storage_gb = disk_info.total / (1024**3)
+            env.max_storage_gb = total_disk / (1024**3)
             
         except Exception as e:
             print(f"Warning: Could not detect system resources: {e}")
         
         return env
     
-    def _apply_optimizations(self):
-        """Apply environment-specific optimizations"""
-        optimizations = []
+    def _apply_environment_tweaks(self):
+        """Adjust environment settings for detected constraints (runs once)"""
+        env = self.environment
         
         # Memory-constrained environments
-        if self.environment.max_memory_gb < 8:
-            optimizations.append("low_memory_mode")
-            self.environment.lazy_loading = True
-            self.environment.widget_update_throttle_ms = 300
+        if env.max_memory_gb < 8:
+            env.lazy_loading = True
+            env.widget_update_throttle_ms = 300
         
         # Limited bandwidth environments
-        if not self.environment.outbound_internet or self.environment.platform == "kaggle":
-            optimizations.append("offline_mode")
-            self.environment.animation_reduced = True
+        if not env.outbound_internet or env.platform == "kaggle":
+            env.animation_reduced = True
         
         # Mobile/small screen optimization
-        if self.environment.max_viewport_width < 1000:
-            optimizations.append("mobile_layout")
-            self.environment.mobile_optimized = True
+        if env.max_viewport_width < 1000:
+            env.mobile_optimized = True
+    
+    @functools.cached_property
+    def adaptations(self) -> Tuple[str, ...]:
+        """Environment-specific optimizations in effect"""
+        env = self.environment
+        optimizations = []
         
-        # GPU-accelerated environments
-        if self.environment.gpu_available:
+        if env.max_memory_gb < 8:
+            optimizations.append("low_memory_mode")
+        if not env.outbound_internet or env.platform == "kaggle":
+            optimizations.append("offline_mode")
+        if env.max_viewport_width < 1000:
+            optimizations.append("mobile_layout")
+        if env.gpu_available:
             optimizations.append("gpu_acceleration")
-        
-        # Network-restricted environments
-        if not self.environment.custom_domains:
+        if not env.custom_domains:
             optimizations.append("tunnel_required")
         
-        self.adaptations = optimizations
-    
-    def get_widget_layout_config(self) -> Dict[str, Any]:
-        """Get optimized widget layout configuration"""
-        config = {
-            'max_width': f"{min(self.environment.max_viewport_width, 1200)}px",
-            'container_padding': '16px' if not self.environment.mobile_optimized else '8px',
-            'font_size': '14px' if not self.environment.mobile_optimized else '12px',
-            'grid_columns': 3 if not self.environment.mobile_optimized else 1,
-            'animation_duration': '0.3s' if not self.environment.animation_reduced else '0.1s',
-            'update_throttle': self.environment.widget_update_throttle_ms,
-            'lazy_loading': self.environment.lazy_loading
+        return tuple(optimizations)
+    
+    def _build_layout_config(self) -> Dict[str, Any]:
+        """Build optimized widget layout configuration"""
+        env = self.environment
+        return {
+            'max_width': f"{min(env.max_viewport_width, 1200)}px",
+            'container_padding': '16px' if not env.mobile_optimized else '8px',
+            'font_size': '14px' if not env.mobile_optimized else '12px',
+            'grid_columns': 3 if not env.mobile_optimized else 1,
+            'animation_duration': '0.3s' if not env.animation_reduced else '0.1s',
+            'update_throttle': env.widget_update_throttle_ms,
+            'lazy_loading': env.lazy_loading
         }
-        
-        return config
+    
+    def get_widget_layout_config(self) -> Mapping[str, Any]:
+        """Get optimized widget layout configuration (read-only view)"""
+        return self._layout_config
     
     def get_performance_css(self) -> str:
         """Get performance-optimized CSS"""
-        layout_config = self.get_widget_layout_config()
-        
-        css = f"""
-        <style>
-        /* Cloud Environment Optimized CSS */
-        .cloud-optimized-container {{
-            max-width: {layout_config['max_width']};
-            margin: 0 auto;
-            padding: {layout_config['container_padding']};
-            font-size: {layout_config['font_size']};
-            transition-duration: {layout_config['animation_duration']};
-        }}
-        
-        .responsive-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 16px;
-            grid-auto-rows: min-content;
-        }}
-        
-        /* Mobile optimization */
-        @media (max-width: 768px) {{
-            .cloud-optimized-container {{
-                padding: 8px;
-                font-size: 12px;
-            }}
-            
-            .responsive-grid {{
-                grid-template-columns: 1fr;
-                gap: 8px;
-            }}
-            
-            .widget-button {{
-                width: 100%;
-                margin: 4px 0;
-            }}
-            
-            .tabbed-interface .tab-content {{
-                padding: 8px;
-            }}
-        }}
-        
-        /* Low memory mode */
-        .low-memory-mode * {{
-            will-change: auto;
-            transform: none;
-            animation: none !important;
-        }}
-        
-        /* Reduced animation mode */
-        .reduced-animations * {{
-            animation-duration: 0.1s !important;
-            transition-duration: 0.1s !important;
-        }}
-        
-        /* High contrast mode for cloud environments */
-        .cloud-high-contrast {{
-            filter: contrast(1.2) brightness(1.1);
-        }}
-        
-        /* Network-optimized images */
-        .network-optimized img {{
-            loading: lazy;
-            decoding: async;
-        }}
-        
-        /* GPU acceleration where available */
-        .gpu-accelerated {{
-            will-change: transform;
-            backface-visibility: hidden;
-            perspective: 1000px;
-        }}
-        
-        /* Platform-specific adjustments */
-        .platform-{self.environment.platform} {{
-            /* Platform-specific styles will be added here */
-        }}
-        
-        /* Colab-specific */
-        .platform-google_colab .widget-container {{
-            max-width: 950px;
-        }}
-        
-        /* Kaggle-specific */
-        .platform-kaggle .notification {{
-            font-size: 13px;
-        }}
-        
-        /* Lightning.ai-specific */
-        .platform-lightning_ai .enhanced-grid {{
-            gap: 20px;
-        }}
-        </style>
-        """
-        
-        return css
+        layout_json = json.dumps(self._layout_config_data, sort_keys=True)
+        return _build_performance_css(self.environment.platform, layout_json)
     
     def get_javascript_polyfills(self) -> str:
         """Get JavaScript polyfills for compatibility"""
-        js_code = f"""
-        <script>
-        // Cloud Environment Compatibility JavaScript
-        window.CloudEnvironment = {{
-            platform: '{self.environment.platform}',
-            provider: '{self.environment.provider}',
-            adaptations: {json.dumps(self.adaptations)},
-            config: {json.dumps(self.get_widget_layout_config())},
-            
-            // Throttled update function
-            throttledUpdate: (function() {{
-                let timeout;
-                return function(func, delay = {self.environment.widget_update_throttle_ms}) {{
-                    clearTimeout(timeout);
-                    timeout = setTimeout(func, delay);
-                }};
-            }})(),
-            
-            // Check if feature is supported
-            isFeatureSupported: function(feature) {{
-                const features = {{
-                    'websockets': {str(self.environment.websocket_support).lower()},
-                    'javascript': {str(self.environment.javascript_enabled).lower()},
-                    'custom_domains': {str(self.environment.custom_domains).lower()},
-                    'outbound_internet': {str(self.environment.outbound_internet).lower()}
-                }};
-                return features[feature] || false;
-            }},
-            
-            // Get recommended tunnel services
-            getRecommendedTunnels: function() {{
-                return {json.dumps(self.environment.tunnel_support)};
-            }},
-            
-            // Performance monitoring
-            startPerformanceMonitoring: function() {{
-                if (typeof performance !== 'undefined') {{
-                    window.cloudPerfStart = performance.now();
-                }}
-            }},
-            
-            endPerformanceMonitoring: function() {{
-                if (typeof performance !== 'undefined' && window.cloudPerfStart) {{
-                    const duration = performance.now() - window.cloudPerfStart;
-                    console.log(`Cloud widget load time: ${{duration.toFixed(2)}}ms`);
-                    return duration;
-                }}
-                return 0;
-            }},
-            
-            // Responsive layout handler
-            handleResize: function() {{
-                const container = document.querySelector('.cloud-optimized-container');
-                if (container) {{
-                    const width = window.innerWidth;
-                    if (width < 768) {{
-                        container.classList.add('mobile-layout');
-                    }} else {{
-                        container.classList.remove('mobile-layout');
-                    }}
-                }}
-            }},
-            
-            // Initialize cloud optimizations
-            initialize: function() {{
-                // Add platform class to body
-                document.body.classList.add('platform-{self.environment.platform}');
-                
-                // Add adaptation classes
-                {json.dumps(self.adaptations)}.forEach(function(adaptation) {{
-                    document.body.classList.add(adaptation.replace('_', '-'));
-                }});
-                
-                // Setup resize handler
-                window.addEventListener('resize', this.handleResize);
-                this.handleResize();
-                
-                // Start performance monitoring
-                this.startPerformanceMonitoring();
-                
-                console.log('Cloud compatibility initialized for:', this.platform);
-            }}
-        }};
-        
-        // Auto-initialize when DOM is ready
-        if (document.readyState === 'loading') {{
-            document.addEventListener('DOMContentLoaded', function() {{
-                CloudEnvironment.initialize();
-            }});
-        }} else {{
-            CloudEnvironment.initialize();
-        }}
-        </script>
-        """
+        env = self.environment
+        features_json = json.dumps({
+            'websockets': env.websocket_support,
+            'javascript': env.javascript_enabled,
+            'custom_domains': env.custom_domains,
+            'outbound_internet': env.outbound_internet
+        })
         
-        return js_code
+        return _build_javascript_polyfills(
+            env.platform, env.provider, env.widget_update_throttle_ms,
+            json.dumps(self.adaptations), json.dumps(self._layout_config_data),
+            features_json, json.dumps(env.tunnel_support)
+        )
     
     def create_compatibility_report(self) -> widgets.HTML:
         """Create a compatibility report widget"""
+        import ipywidgets as widgets
         
-        # Environment info
-        env_info = f"""
-        <div style="background: linear-gradient(135deg, rgba(139,0,0,0.1), rgba(220,20,60,0.05)); 
-                    border: 2px solid #DC143C; border-radius: 12px; padding: 20px; margin: 16px 0;">
-            <h3 style="color: #8B0000; margin: 0 0 16px 0; font-family: 'Cinzel', serif;">
-                🌐 Cloud Environment Report
-            </h3>
-            
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 16px; margin-bottom: 16px;">
-                <div>
-                    <h4 style="color: #DC143C; margin: 0 0 8px 0;">Environment</h4>
-                    <p style="margin: 4px 0; color: #333;">Platform: <strong>{self.environment.platform}</strong></p>
-                    <p style="margin: 4px 0; color: #333;">Provider: <strong>{self.environment.provider}</strong></p>
-                    <p style="margin: 4px 0; color: #333;">Region: <strong>{self.environment.region or 'Unknown'}</strong></p>
-                </div>
-                
-                <div>
-                    <h4 style="color: #DC143C; margin: 0 0 8px 0;">Resources</h4>
-                    <p style="margin: 4px 0; color: #333;">Memory: <strong>{self.environment.max_memory_gb:.1f} GB</strong></p>
-                    <p style="margin: 4px 0; color: #333;">CPU Cores: <strong>{self.environment.cpu_cores}</strong></p>
-                    <p style="margin: 4px 0; color: #333;">GPU: <strong>{'Available' if self.environment.gpu_available else 'Not Available'}</strong>
-                    {f' ({self.environment.gpu_memory_gb:.1f} GB)' if self.environment.gpu_available else ''}</p>
-                </div>
-                
-                <div>
-                    <h4 style="color: #DC143C; margin: 0 0 8px 0;">Network</h4>
-                    <p style="margin: 4px 0; color: #333;">Internet: <strong>{'Full' if self.environment.outbound_internet else 'Limited'}</strong></p>
-                    <p style="margin: 4px 0; color: #333;">Custom Domains: <strong>{'Yes' if self.environment.custom_domains else 'No'}</strong></p>
-                    <p style="margin: 4px 0; color: #333;">Tunnels: <strong>{len(self.environment.tunnel_support)} supported</strong></p>
-                </div>
-            </div>
-            
-            <div style="border-top: 1px solid rgba(220,20,60,0.3); padding-top: 16px;">
-                <h4 style="color: #DC143C; margin: 0 0 8px 0;">Active Optimizations</h4>
-                <div style="display: flex; flex-wrap: wrap; gap: 8px;">
-                    {self._generate_optimization_badges()}
-                </div>
-            </div>
-        </div>
-        """
+        env = self.environment
+        env_info = _REPORT_TEMPLATE.format_map({
+            'platform': env.platform,
+            'provider': env.provider,
+            'region': env.region or 'Unknown',
+            'memory': env.max_memory_gb,
+            'cores': env.cpu_cores,
+            'gpu': 'Available' if env.gpu_available else 'Not Available',
+            'gpu_memory': f' ({env.gpu_memory_gb:.1f} GB)' if env.gpu_available else '',
+            'internet': 'Full' if env.outbound_internet else 'Limited',
+            'custom_domains': 'Yes' if env.custom_domains else 'No',
+            'tunnels': len(env.tunnel_support),
+            'badges': self._generate_optimization_badges()
+        })
         
         return widgets.HTML(value=env_info)
     
     def _generate_optimization_badges(self) -> str:
         """Generate optimization badges HTML"""
-        badges = []
-        
-        for optimization in self.adaptations:
-            badge_text = optimization.replace('_', ' ').title()
-            badges.append(f"""
-                <span style="background: #DC143C; color: white; padding: 4px 8px; 
-                            border-radius: 12px; font-size: 11px; font-weight: 600;">
-                    {badge_text}
-                </span>
-            """)
-        
-        return ''.join(badges) if badges else '<span style="color: #666; font-style: italic;">No specific optimizations applied</span>'
+        if self._badges_html is None:
+            self._badges_html = ''.join(
+                _BADGE_TEMPLATE.format(text=optimization.replace('_', ' ').title())
+                for optimization in self.adaptations
+            ) or _NO_OPTIMIZATIONS_HTML
+        return self._badges_html
     
-    def get_tunnel_recommendations(self) -> List[Dict[str, str]]:
+    def get_tunnel_recommendations(self) -> List[TunnelRecommendation]:
         """Get tunnel service recommendations for current environment"""
-        recommendations = []
-        
-        tunnel_configs = {
-            'ngrok': {
-                'name': 'ngrok',
-                'description': 'Secure tunnels with HTTPS',
-                'priority': 'high',
-                'setup_difficulty': 'easy',
-                'free_tier': 'yes'
-            },
-            'cloudflared': {
-                'name': 'Cloudflare Tunnel',
-                'description': 'Fast and reliable tunneling',
-                'priority': 'high',
-                'setup_difficulty': 'medium',
-                'free_tier': 'yes'
-            },
-            'localtunnel': {
-                'name': 'LocalTunnel',
-                'description': 'Simple local tunnel solution',
-                'priority': 'medium',
-                'setup_difficulty': 'easy',
-                'free_tier': 'yes'
-            },
-            'gradio': {
-                'name': 'Gradio Share',
-                'description': 'Built-in sharing for ML demos',
-                'priority': 'medium',
-                'setup_difficulty': 'easy',
-                'free_tier': 'yes'
-            }
-        }
+        if self._tunnel_recommendations is not None:
+            return self._tunnel_recommendations
         
-        for tunnel_name in self.environment.tunnel_support:
-            if tunnel_name in tunnel_configs:
-                config = tunnel_configs[tunnel_name].copy()
-                
-                # Platform-specific adjustments
-                if self.environment.platform == 'kaggle' and tunnel_name != 'ngrok':
-                    config['priority'] = 'low'  # Kaggle works best with ngrok
-                elif self.environment.platform == 'google_colab' and tunnel_name in ['ngrok', 'cloudflared']:
-                    config['priority'] = 'high'  # Colab works well with these
-                
-                recommendations.append(config)
+        overrides = _TUNNEL_PRIORITY_OVERRIDES.get(self.environment.platform, {})
+        recommendations = [
+            replace(_TUNNEL_CONFIGS[name], priority=overrides[name]) if name in overrides else _TUNNEL_CONFIGS[name]
+            for name in self.environment.tunnel_support if name in _TUNNEL_CONFIGS
+        ]
         
         # Sort by priority
-        priority_order = {'high': 0, 'medium': 1, 'low': 2}
-        recommendations.sort(key=lambda x: priority_order.get(x['priority'], 3))
+        recommendations.sort(key=operator.attrgetter('priority'))
         
+        self._tunnel_recommendations = recommendations
         return recommendations
     
     def apply_responsive_styling(self):
         """Apply responsive styling to the current environment"""
+        from IPython.display import display, HTML
         # Inject performance CSS
         display(HTML(self.get_performance_css()))
         
@@ -658,6 +710,7 @@ class CloudCompatibilityManager:
     
     def test_compatibility(self) -> Dict[str, Any]:
         """Test compatibility features and return results"""
+        from IPython.display import display, HTML
         results = {
             'environment_detected': True,
             'javascript_working': False,
@@ -680,13 +733,9 @@ class CloudCompatibilityManager:
         except:
             results['javascript_working'] = False
         
-        # Test network access
+        # Test network access (probed once per process, skipped when known offline)
         if self.environment.outbound_internet:
-            try:
-                response = requests.get('https://httpbin.org/status/200', timeout=5)
-                results['network_accessible'] = response.status_code == 200
-            except:
-                results['network_accessible'] = False
+            results['network_accessible'] = _probe_network()
         
         # Calculate performance score
         score = 0
@@ -701,11 +750,19 @@ class CloudCompatibilityManager:
     
     def display_compatibility_dashboard(self):
         """Display comprehensive compatibility dashboard"""
+        import ipywidgets as widgets
+        from IPython.display import display
         # Apply styling first
         self.apply_responsive_styling()
         
-        # Create dashboard components
-        report_widget = self.create_compatibility_report()
+        # Paint the header and environment report right away; the remaining
+        # sections (the test run may block on the network probe) are appended
+        # to the already-displayed container as they become ready
+        dashboard = widgets.VBox([
+            widgets.HTML(_DASHBOARD_HEADER_HTML),
+            self.create_compatibility_report()
+        ], layout=widgets.Layout(width='100%'))
+        display(dashboard)
         
         # Test results
         test_results = self.test_compatibility()
@@ -718,117 +775,271 @@ class CloudCompatibilityManager:
         # Performance metrics
         metrics_widget = self._create_metrics_widget()
         
-        # Main dashboard
-        dashboard = widgets.VBox([
-            widgets.HTML("""
-            <div class="cloud-optimized-container">
-                <h2 style="color: #8B0000; text-align: center; font-family: 'Cinzel', serif; margin-bottom: 24px;">
-                    🚀 Enhanced Widget System - Cloud Compatibility Dashboard
-                </h2>
-            </div>
-            """),
-            report_widget,
-            test_widget,
-            tunnel_widget,
-            metrics_widget
-        ], layout=widgets.Layout(width='100%'))
-        
-        display(dashboard)
+        dashboard.children += (test_widget, tunnel_widget, metrics_widget)
     
     def _create_test_results_widget(self, results: Dict[str, Any]) -> widgets.HTML:
         """Create test results widget"""
-        test_items = []
-        
-        for test_name, result in results.items():
-            if test_name == 'performance_score':
-                continue
-                
-            status = "✅" if result else "❌"
-            color = "#46FF46" if result else "#FF4444"
-            
-            test_items.append(f"""
-            <div style="display: flex; justify-content: space-between; padding: 8px 0; border-bottom: 1px solid rgba(220,20,60,0.1);">
-                <span style="color: #333;">{test_name.replace('_', ' ').title()}</span>
-                <span style="color: {color}; font-weight: bold;">{status} {result}</span>
-            </div>
-            """)
+        import ipywidgets as widgets
+        test_items = [
+            _TEST_ITEM_TEMPLATE.format_map({
+                'label': test_name.replace('_', ' ').title(),
+                'color': "#46FF46" if result else "#FF4444",
+                'status': "✅" if result else "❌",
+                'result': result
+            })
+            for test_name, result in results.items() if test_name != 'performance_score'
+        ]
         
         score_color = "#46FF46" if results['performance_score'] >= 75 else "#FFA500" if results['performance_score'] >= 50 else "#FF4444"
         
-        test_html = f"""
-        <div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
-            <h4 style="color: #8B0000; margin: 0 0 16px 0;">🧪 Compatibility Test Results</h4>
-            {''.join(test_items)}
-            <div style="margin-top: 16px; padding: 12px; background: rgba(220,20,60,0.1); border-radius: 6px; text-align: center;">
-                <strong style="color: {score_color};">Performance Score: {results['performance_score']}/100</strong>
-            </div>
-        </div>
-        """
+        test_html = _TEST_RESULTS_TEMPLATE.format_map({
+            'items': ''.join(test_items),
+            'score_color': score_color,
+            'score': results['performance_score']
+        })
         
         return widgets.HTML(value=test_html)
     
-    def _create_tunnel_widget(self, recommendations: List[Dict[str, str]]) -> widgets.HTML:
+    def _create_tunnel_widget(self, recommendations: List[TunnelRecommendation]) -> widgets.HTML:
         """Create tunnel recommendations widget"""
+        import ipywidgets as widgets
         if not recommendations:
-            tunnel_html = """
-            <div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
-                <h4 style="color: #8B0000; margin: 0 0 16px 0;">🌐 Tunnel Recommendations</h4>
-                <p style="color: #666; font-style: italic;">No tunnel services recommended for this environment.</p>
-            </div>
-            """
+            tunnel_html = _EMPTY_TUNNEL_HTML
         else:
-            tunnel_items = []
+            # Stream the cards between the list head/tail: one final copy instead of join + format
+            buf = io.StringIO()
+            buf.write(_TUNNEL_LIST_HEAD)
             for tunnel in recommendations:
-                priority_color = {"high": "#46FF46", "medium": "#FFA500", "low": "#FF4444"}.get(tunnel['priority'], '#666')
-                
-                tunnel_items.append(f"""
-                <div style="border: 1px solid rgba(220,20,60,0.2); border-radius: 6px; padding: 12px; margin: 8px 0;">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                        <h5 style="color: #8B0000; margin: 0;">{tunnel['name']}</h5>
-                        <span style="background: {priority_color}; color: white; padding: 2px 8px; border-radius: 10px; font-size: 10px;">
-                            {tunnel['priority'].upper()}
-                        </span>
-                    </div>
-                    <p style="color: #333; margin: 4px 0; font-size: 13px;">{tunnel['description']}</p>
-                    <div style="display: flex; justify-content: space-between; font-size: 11px; color: #666;">
-                        <span>Setup: {tunnel['setup_difficulty'].title()}</span>
-                        <span>Free Tier: {tunnel['free_tier'].title()}</span>
-                    </div>
-                </div>
-                """)
-            
-            tunnel_html = f"""
-            <div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
-                <h4 style="color: #8B0000; margin: 0 0 16px 0;">🌐 Recommended Tunnel Services</h4>
-                {''.join(tunnel_items)}
-            </div>
-            """
+                buf.write(_render_tunnel_card(tunnel))
+            buf.write(_TUNNEL_LIST_TAIL)
+            tunnel_html = buf.getvalue()
         
-        return widgets.HTML(value=tunnel_html)
+        if self._tunnel_widget is None:
+            self._tunnel_widget = widgets.HTML(value=tunnel_html)
+        else:
+            self._tunnel_widget.value = tunnel_html
+        return self._tunnel_widget
+    
+    def update_metrics(self, **metrics):
+        """Update performance metrics and mark the metrics widget for re-render
+        (call with no arguments after editing performance_metrics directly)"""
+        self.performance_metrics.update(metrics)
+        self._metrics_dirty = True
     
     def _create_metrics_widget(self) -> widgets.HTML:
         """Create performance metrics widget"""
-        metrics_html = f"""
-        <div style="background: rgba(139,0,0,0.05); border: 1px solid #DC143C; border-radius: 8px; padding: 16px; margin: 16px 0;">
-            <h4 style="color: #8B0000; margin: 0 0 16px 0;">📊 Performance Metrics</h4>
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 12px;">
-                <div style="text-align: center; padding: 12px; background: rgba(220,20,60,0.1); border-radius: 6px;">
-                    <div style="font-size: 24px; font-weight: bold; color: #8B0000;">{self.performance_metrics['widget_count']}</div>
-                    <div style="font-size: 12px; color: #666;">Active Widgets</div>
-                </div>
-                <div style="text-align: center; padding: 12px; background: rgba(220,20,60,0.1); border-radius: 6px;">
-                    <div style="font-size: 24px; font-weight: bold; color: #8B0000;">{self.performance_metrics['load_time']:.2f}s</div>
-                    <div style="font-size: 12px; color: #666;">Load Time</div>
-                </div>
-                <div style="text-align: center; padding: 12px; background: rgba(220,20,60,0.1); border-radius: 6px;">
-                    <div style="font-size: 24px; font-weight: bold; color: #8B0000;">{self.performance_metrics['memory_usage']:.1f}MB</div>
-                    <div style="font-size: 12px; color: #666;">Memory Usage</div>
-                </div>
-            </div>
-        </div>
-        """
+        if not self._metrics_dirty and self._metrics_widget is not None:
+            return self._metrics_widget
         
-        return widgets.HTML(value=metrics_html)
+        import ipywidgets as widgets
+        m = self.performance_metrics
+        metrics_html = _METRICS_TEMPLATE % (m['widget_count'], m['load_time'], m['memory_usage'])
+        
+        if self._metrics_widget is None:
+            self._metrics_widget = widgets.HTML(value=metrics_html)
+        else:
+            self._metrics_widget.value = metrics_html
+        self._metrics_dirty = False
+        return self._metrics_widget
+
+
+# Cached CSS/JS builders
+@functools.lru_cache(maxsize=16)
+def _build_performance_css(platform_name: str, layout_json: str) -> str:
+    """Render the performance CSS; cached on hashable primitives"""
+    layout_config = json.loads(layout_json)
+    
+    css = f"""
+    <style>
+    /* Cloud Environment Optimized CSS */
+    .cloud-optimized-container {{
+        max-width: {layout_config['max_width']};
+        margin: 0 auto;
+        padding: {layout_config['container_padding']};
+        font-size: {layout_config['font_size']};
+        transition-duration: {layout_config['animation_duration']};
+    }}
+    
+    .responsive-grid {{
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+        gap: 16px;
+        grid-auto-rows: min-content;
+    }}
+    
+    /* Mobile optimization */
+    @media (max-width: 768px) {{
+        .cloud-optimized-container {{
+            padding: 8px;
+            font-size: 12px;
+        }}
+        
+        .responsive-grid {{
+            grid-template-columns: 1fr;
+            gap: 8px;
+        }}
+        
+        .widget-button {{
+            width: 100%;
+            margin: 4px 0;
+        }}
+        
+        .tabbed-interface .tab-content {{
+            padding: 8px;
+        }}
+    }}
+    
+    /* Low memory mode */
+    .low-memory-mode * {{
+        will-change: auto;
+        transform: none;
+        animation: none !important;
+    }}
+    
+    /* Reduced animation mode */
+    .reduced-animations * {{
+        animation-duration: 0.1s !important;
+        transition-duration: 0.1s !important;
+    }}
+    
+    /* High contrast mode for cloud environments */
+    .cloud-high-contrast {{
+        filter: contrast(1.2) brightness(1.1);
+    }}
+    
+    /* Network-optimized images */
+    .network-optimized img {{
+        loading: lazy;
+        decoding: async;
+    }}
+    
+    /* GPU acceleration where available */
+    .gpu-accelerated {{
+        will-change: transform;
+        backface-visibility: hidden;
+        perspective: 1000px;
+    }}
+    
+    /* Platform-specific adjustments */
+    .platform-{platform_name} {{
+        /* Platform-specific styles will be added here */
+    }}
+    
+    /* Colab-specific */
+    .platform-google_colab .widget-container {{
+        max-width: 950px;
+    }}
+    
+    /* Kaggle-specific */
+    .platform-kaggle .notification {{
+        font-size: 13px;
+    }}
+    
+    /* Lightning.ai-specific */
+    .platform-lightning_ai .enhanced-grid {{
+        gap: 20px;
+    }}
+    </style>
+    """
+    
+    return _minify_markup(css)
+
+
+@functools.lru_cache(maxsize=16)
+def _build_javascript_polyfills(platform_name: str, provider: str, throttle_ms: int, adaptations_json: str,
+                                config_json: str, features_json: str, tunnels_json: str) -> str:
+    """Render the compatibility JavaScript; cached on hashable primitives"""
+    js_code = f"""
+    <script>
+    // Cloud Environment Compatibility JavaScript
+    window.CloudEnvironment = {{
+        platform: '{platform_name}',
+        provider: '{provider}',
+        adaptations: {adaptations_json},
+        config: {config_json},
+        
+        // Throttled update function
+        throttledUpdate: (function() {{
+            let timeout;
+            return function(func, delay = {throttle_ms}) {{
+                clearTimeout(timeout);
+                timeout = setTimeout(func, delay);
+            }};
+        }})(),
+        
+        // Check if feature is supported
+        isFeatureSupported: function(feature) {{
+            const features = {features_json};
+            return features[feature] || false;
+        }},
+        
+        // Get recommended tunnel services
+        getRecommendedTunnels: function() {{
+            return {tunnels_json};
+        }},
+        
+        // Performance monitoring
+        startPerformanceMonitoring: function() {{
+            if (typeof performance !== 'undefined') {{
+                window.cloudPerfStart = performance.now();
+            }}
+        }},
+        
+        endPerformanceMonitoring: function() {{
+            if (typeof performance !== 'undefined' && window.cloudPerfStart) {{
+                const duration = performance.now() - window.cloudPerfStart;
+                console.log(`Cloud widget load time: ${{duration.toFixed(2)}}ms`);
+                return duration;
+            }}
+            return 0;
+        }},
+        
+        // Responsive layout handler
+        handleResize: function() {{
+            const container = document.querySelector('.cloud-optimized-container');
+            if (container) {{
+                const width = window.innerWidth;
+                if (width < 768) {{
+                    container.classList.add('mobile-layout');
+                }} else {{
+                    container.classList.remove('mobile-layout');
+                }}
+            }}
+        }},
+        
+        // Initialize cloud optimizations
+        initialize: function() {{
+            // Add platform class to body
+            document.body.classList.add('platform-{platform_name}');
+            
+            // Add adaptation classes
+            {adaptations_json}.forEach(function(adaptation) {{
+                document.body.classList.add(adaptation.replace('_', '-'));
+            }});
+            
+            // Setup resize handler
+            window.addEventListener('resize', this.handleResize);
+            this.handleResize();
+            
+            // Start performance monitoring
+            this.startPerformanceMonitoring();
+            
+            console.log('Cloud compatibility initialized for:', this.platform);
+        }}
+    }};
+    
+    // Auto-initialize when DOM is ready
+    if (document.readyState === 'loading') {{
+        document.addEventListener('DOMContentLoaded', function() {{
+            CloudEnvironment.initialize();
+        }});
+    }} else {{
+        CloudEnvironment.initialize();
+    }}
+    </script>
+    """
+    
+    return js_code
 
 
 # Factory function and demo
@@ -19,6 +19,7 @@ import shlex
 import time
 import json
 import sys
+import ast
 import re
 import os
 
@@ -28,20 +29,23 @@ CD = os.chdir
 ipySys = get_ipython().system
 ipyRun = get_ipython().run_line_magic
 
-# Constants (auto-convert env vars to Path)
-PATHS = {k: Path(v) for k, v in osENV.items() if k.endswith('_path')}   # k -> key; v -> value
-
-HOME = PATHS['home_path']
-VENV = PATHS['venv_path']
-SCR_PATH = PATHS['scr_path']
-SETTINGS_PATH = PATHS['settings_path']
+# Constants (env vars -> Path)
+HOME = Path(osENV['home_path'])
+VENV = Path(osENV['venv_path'])
+SCR_PATH = Path(osENV['scr_path'])
+SETTINGS_PATH = Path(osENV['settings_path'])
 
 SCRIPTS = SCR_PATH / 'scripts'
 
-LANG = js.read(SETTINGS_PATH, 'ENVIRONMENT.lang')
-ENV_NAME = js.read(SETTINGS_PATH, 'ENVIRONMENT.env_name')
-UI = js.read(SETTINGS_PATH, 'WEBUI.current')
-WEBUI = js.read(SETTINGS_PATH, 'WEBUI.webui_path')
+# settings.json is parsed once for all four constants
+_settings = js.read(SETTINGS_PATH)
+_environment = _settings.get('ENVIRONMENT') or {}
+_webui = _settings.get('WEBUI') or {}
+
+LANG = _environment.get('lang')
+ENV_NAME = _environment.get('env_name')
+UI = _webui.get('current')
+WEBUI = _webui.get('webui_path')
 
 
 # Text Colors (\033)
@@ -164,10 +168,11 @@ if venv_needs_reinstall:
 def load_settings(path):
     """Load settings from a JSON file."""
     try:
-        # Safely read each section, defaulting to empty dict if None
-        environment = js.read(path, 'ENVIRONMENT') or {}
-        widgets = js.read(path, 'WIDGETS') or {}
-        webui = js.read(path, 'WEBUI') or {}
+        # Parse the file once, then safely read each section, defaulting to empty dict if None
+        data = js.read(path)
+        environment = data.get('ENVIRONMENT') or {}
+        widgets = data.get('WIDGETS') or {}
+        webui = data.get('WEBUI') or {}
         
         return {
             **environment,
@@ -391,10 +396,22 @@ def handle_errors(func):
     return wrapper
 
 # Get XL or 1.5 models list
-## model_list | vae_list | controlnet_list
+## model_list | vae_list | lora_list | controlnet_list
+def read_model_lists(file_path):
+    """Read the top-level dict literals of a models-data file without executing it."""
+    tree = ast.parse(Path(file_path).read_text())
+    return {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in tree.body
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+    }
+
 model_files = '_xl-models-data.py' if XL_models else '_models-data.py'
-with open(f"{SCRIPTS}/{model_files}") as f:
-    exec(f.read())
+model_lists = read_model_lists(SCRIPTS / model_files)
+model_list = model_lists['model_list']
+vae_list = model_lists['vae_list']
+lora_list = model_lists['lora_list']
+controlnet_list = model_lists['controlnet_list']
 
 ## Downloading model and stuff | oh~ Hey! If you're freaked out by that code too, don't worry, me too!
 print('📦 Downloading models and stuff...', end='')
@@ -1,6 +1,5 @@
 import sys
 import os
-from pathlib import Path
 
 # Robustly add the 'modules' directory to the Python path.
 # This is necessary for the script to find its dependencies when run from
@@ -8,27 +7,28 @@ from pathlib import Path
 try:
     # Get the absolute path of the directory containing this script.
     # __file__ is the most reliable way to get the script's location.
-    script_dir = Path(__file__).resolve().parent
+    # (plain os.path strings: this runs before anything else, so keep it cheap)
+    script_dir = os.path.dirname(os.path.realpath(__file__))
     
     # Navigate up to the project root directory (which contains 'scripts', 'modules', etc.)
     # The script is in .../scripts/en, so we go up two levels.
-    project_root = script_dir.parent.parent
+    project_root = os.path.dirname(os.path.dirname(script_dir))
     
     # Construct the path to the 'modules' directory.
-    modules_path = project_root / 'modules'
+    modules_path = os.path.join(project_root, 'modules')
     
     # Add the 'modules' path to the beginning of sys.path if it's not already there.
     # This ensures it's checked first during imports.
-    if str(modules_path) not in sys.path:
-        sys.path.insert(0, str(modules_path))
+    if modules_path not in sys.path:
+        sys.path.insert(0, modules_path)
 
 except NameError:
     # Fallback for environments where __file__ is not defined (e.g., some interactive shells)
     # This is less reliable but better than nothing.
     print("Warning: __file__ is not defined. Falling back to CWD-based path resolution.")
-    modules_path = Path(os.getcwd()) / 'modules'
-    if str(modules_path) not in sys.path:
-        sys.path.insert(0, str(modules_path))
+    modules_path = os.path.join(os.getcwd(), 'modules')
+    if modules_path not in sys.path:
+        sys.path.insert(0, modules_path)
 # ~ widgets.py | by ScarySingleDocs ~
 
 from widget_factory import WidgetFactory        # WIDGETS
@@ -37,21 +37,41 @@ import json_utils as js                         # JSON
 
 from IPython.display import display, Javascript
 from google.colab import output
+from contextlib import ExitStack
+from functools import lru_cache
+from html import escape
 import ipywidgets as widgets
 from pathlib import Path
+import asyncio
 import json
-import os
+import ast
 
 
 osENV = os.environ
 
-# Constants (auto-convert env vars to Path)
-PATHS = {k: Path(v) for k, v in osENV.items() if k.endswith('_path')}   # k -> key; v -> value
+# Constants (env vars -> Path)
+HOME = Path(osENV['home_path'])
+SCR_PATH = Path(osENV['scr_path'])
+SETTINGS_PATH = Path(osENV['settings_path'])
+_settings_data = None    # parsed settings.json, dropped whenever we write it
+
+def read_settings(key, default=None):
+    """Look up a dot-separated key in settings.json, parsing the file only once."""
+    global _settings_data
+    if _settings_data is None:
+        _settings_data = js.read(SETTINGS_PATH)
 
-HOME = PATHS['home_path']
-SCR_PATH = PATHS['scr_path']
-SETTINGS_PATH = PATHS['settings_path']
-ENV_NAME = js.read(SETTINGS_PATH, 'ENVIRONMENT.env_name')
+    value = _settings_data
+    for part in key.split('.'):
+        value = value.get(part) if isinstance(value, dict) else None
+    return default if value is None else value
+
+def drop_settings_cache():
+    """Forget the parsed settings.json; call after writing it."""
+    global _settings_data
+    _settings_data = None
+
+ENV_NAME = read_settings('ENVIRONMENT.env_name')
 
 SCRIPTS = SCR_PATH / 'scripts'
 
@@ -60,30 +80,68 @@ JS = SCR_PATH / 'JS'
 widgets_css = CSS / 'main-widgets.css'
 widgets_js = JS / 'main-widgets.js'
 
+# Static markup, built once
+SAVE_BUTTON_HTML = '''
+<button class="button button_save">
+    <span class="button-text">Save</span>
+</button>
+'''
+UTILITY_BUTTONS_HTML = ''.join([
+    '<div class="utility-buttons">',
+    '<span class="section-title">Utils</span>',
+    *(f'<div class="utility-button" title="{title}">{icon}</div>'
+      for title, icon in (('Google Drive', '🔗'), ('Export', '⬇'), ('Import', '⬆'))),
+    '</div>'
+])
+SETTINGS_TITLE_HTML = '<span class="section-title">Settings</span>'
+TAB_BAR_HTML = ''.join([
+    '<div class="tab-container">',
+    *(f'<button type="button" class="tab-button{active}">{label}</button>'
+      for label, active in (('Models', ' active'), ('VAE', ''), ('LoRA', ''), ('ControlNet', ''))),
+    '</div>'
+])
+
 # Global state for widget toggles
 gdrive_toggle_state = False
 
 
 # ================ WIDGETS (Main Container) ================
 
-# create_expandable_button removed as it's obsolete.
+MODEL_LIST_KEYS = ('model_list', 'vae_list', 'lora_list', 'controlnet_list')
+
+def _parse_lists(source):
+    """Parse a models-data file and return the option names of each list."""
+    tree = ast.parse(source.read_text())
+    lists = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        target = node.targets[0]
+        if isinstance(target, ast.Name) and target.id in MODEL_LIST_KEYS:
+            value = node.value
+            # Only the names are shown, so skip evaluating the (much larger) url lists
+            if isinstance(value, ast.Dict) and None not in value.keys:
+                lists[target.id] = [ast.literal_eval(k) for k in value.keys]
+            else:
+                lists[target.id] = list(ast.literal_eval(value).keys())
+    return lists
+
+@lru_cache(maxsize=None)
+def _load_lists(file_path):
+    """Load the lists of a models-data file, parsing each file once per session."""
+    return _parse_lists(Path(file_path))
+
+MODEL_DATA_TYPES = {
+    'model': 'model_list',
+    'vae': 'vae_list',
+    'lora': 'lora_list',
+    'cnet': 'controlnet_list'
+}
 
+@lru_cache(maxsize=None)
 def read_model_data(file_path, data_type):
-    """Reads model, VAE, LoRA, or ControlNet data from the specified file."""
-    type_map = {
-        'model': ('model_list', ['none']),
-        'vae': ('vae_list', ['none', 'ALL']),
-        'lora': ('lora_list', ['none', 'ALL']),
-        'cnet': ('controlnet_list', ['none', 'ALL'])
-    }
-    key, prefixes = type_map[data_type]
-    local_vars = {}
-
-    with open(file_path) as f:
-        exec(f.read(), {}, local_vars)
-
-    names = list(local_vars[key].keys())
-    return prefixes + names
+    """Reads model, VAE, LoRA, or ControlNet names from the specified file (as a cached tuple)."""
+    return tuple(_load_lists(str(file_path))[MODEL_DATA_TYPES[data_type]])
 
 WEBUI_SELECTION = {
     'A1111':   "--xformers --no-half-vae",
@@ -93,6 +151,7 @@ WEBUI_SELECTION = {
     'ReForge': "--xformers --cuda-stream",              # Remove: --pin-shared-memory
     'SD-UX':   "--xformers --no-half-vae"
 }
+WEBUI_NAMES = tuple(WEBUI_SELECTION)    # dropdown options, built once
 
 # Initialize the WidgetFactory
 factory = WidgetFactory()
@@ -101,25 +160,17 @@ HR = widgets.HTML('<hr>')
 # --- MODEL ---
 """Create model selection widgets."""
 model_header = factory.create_header('Model Selection')
-model_options = read_model_data(f"{SCRIPTS}/_models-data.py", 'model')
 # inpainting_model_widget and XL_models_widget are now part of the consolidated_bar
 # switch_model_widget is no longer needed.
 
 # --- VAE ---
-"""Create VAE selection widgets."""
-vae_header = factory.create_header('VAE Selection')
-vae_options = read_model_data(f"{SCRIPTS}/_models-data.py", 'vae')
+# The VAE selection is now a tab of the download system below.
 
 # --- TABBED DOWNLOAD SYSTEM ---
 """Create tabbed download interface for Models, VAE, LoRA, and ControlNet."""
 
-# Tab buttons
-tab_models = factory.create_button('Models', class_names=['tab-button', 'active'])
-tab_vae = factory.create_button('VAE', class_names=['tab-button'])
-tab_lora = factory.create_button('LoRA', class_names=['tab-button'])
-tab_controlnet = factory.create_button('ControlNet', class_names=['tab-button'])
-
-tab_container = factory.create_hbox([tab_models, tab_vae, tab_lora, tab_controlnet], class_names=['tab-container'])
+# Tab buttons (plain HTML: switching is handled entirely in JS)
+tab_container = factory.create_html(TAB_BAR_HTML, class_names=['tab-bar'])
 
 # Tab content containers
 tab_content_models = factory.create_vbox([], class_names=['tab-content', 'active'])
@@ -128,74 +179,74 @@ tab_content_lora = factory.create_vbox([], class_names=['tab-content'])
 tab_content_controlnet = factory.create_vbox([], class_names=['tab-content'])
 
 # Create toggle buttons for each type
-def create_toggle_buttons(data_type, options):
-    """Create toggle buttons for a given data type."""
-    buttons = []
-    for option in options:
-        if option not in ['none', 'ALL']:
-            button = factory.create_button(option, class_names=['model-item', data_type])
-            buttons.append(button)
-    return buttons
-
-# Generate toggle buttons for each tab
-model_toggle_buttons = create_toggle_buttons('model', model_options)
-vae_toggle_buttons = create_toggle_buttons('vae', vae_options)
-lora_options = read_model_data(f"{SCRIPTS}/_models-data.py", 'lora')
-lora_toggle_buttons = create_toggle_buttons('lora', lora_options)
-controlnet_options = read_model_data(f"{SCRIPTS}/_models-data.py", 'cnet')
-controlnet_toggle_buttons = create_toggle_buttons('controlnet', controlnet_options)
-
-# Add toggle buttons to tab contents
-tab_content_models.children = model_toggle_buttons
-tab_content_vae.children = vae_toggle_buttons
-tab_content_lora.children = lora_toggle_buttons
-tab_content_controlnet.children = controlnet_toggle_buttons
-
-# Tab switching function
-def switch_tab(button):
-    """Switch between tabs and update content."""
-    tabs = [tab_models, tab_vae, tab_lora, tab_controlnet]
-    contents = [tab_content_models, tab_content_vae, tab_content_lora, tab_content_controlnet]
-    
-    # Remove active class from all tabs and contents
-    for tab, content in zip(tabs, contents):
-        tab.remove_class('active')
-        content.remove_class('active')
-    
-    # Add active class to clicked tab and corresponding content
-    button.add_class('active')
-    tab_index = tabs.index(button)
-    contents[tab_index].add_class('active')
-
-# Toggle button function
-def toggle_button(button):
-    """Toggle button state on/off."""
-    # Use a custom attribute to track toggle state
-    if not hasattr(button, '_is_active'):
-        button._is_active = False
-    
-    button._is_active = not button._is_active
-    
-    if button._is_active:
-        button.add_class('active')
+TOGGLE_ITEM_TEMPLATE = ('<button type="button" class="model-item {type}{active}" '
+                        'data-type="{type}" data-name="{name}">{name}</button>')
+
+@lru_cache(maxsize=32)
+def create_toggle_buttons(data_type, options, bits=0):
+    """Render toggle buttons for a given data type as plain HTML; bit i marks option i active.
+    Cached: switching SDXL back and forth re-renders the same (options, bits) markup."""
+    return ''.join(
+        TOGGLE_ITEM_TEMPLATE.format(type=data_type, name=escape(option), active=' active' if bits >> i & 1 else '')
+        for i, option in enumerate(options)
+    )
+
+# Toggle-button tabs: state name -> (data type, tab content)
+TOGGLE_TABS = {
+    'model': ('model', tab_content_models),
+    'vae': ('vae', tab_content_vae),
+    'lora': ('lora', tab_content_lora),
+    'controlnet': ('cnet', tab_content_controlnet)
+}
+toggle_options = {}                           # name -> option names (tuple), only for tabs built so far
+toggle_html = {}                              # name -> the tab's single HTML widget, reused on rebuilds
+TOGGLE_BITS = dict.fromkeys(TOGGLE_TABS, 0)   # name -> bitmask of active button indices
+TOGGLE_TAB_NAMES = tuple(TOGGLE_TABS)         # tab index (as sent by the JS) -> name
+toggle_data_file = '_models-data.py'
+
+def apply_toggle_bits(name):
+    """Render the buttons of a built tab, marking them active according to its bitmask."""
+    options = toggle_options[name]
+    TOGGLE_BITS[name] &= (1 << len(options)) - 1
+    markup = f'<div class="toggle-grid">{create_toggle_buttons(name, options, TOGGLE_BITS[name])}</div>'
+
+    html = toggle_html.get(name)
+    if html is None:
+        toggle_html[name] = factory.create_html(markup)
+        TOGGLE_TABS[name][1].children = [toggle_html[name]]
     else:
-        button.remove_class('active')
-
-# Connect tab buttons to switch function
-tab_models.on_click(switch_tab)
-tab_vae.on_click(switch_tab)
-tab_lora.on_click(switch_tab)
-tab_controlnet.on_click(switch_tab)
-
-# Connect all toggle buttons to toggle function
-for button in model_toggle_buttons:
-    button.on_click(toggle_button)
-for button in vae_toggle_buttons:
-    button.on_click(toggle_button)
-for button in lora_toggle_buttons:
-    button.on_click(toggle_button)
-for button in controlnet_toggle_buttons:
-    button.on_click(toggle_button)
+        html.value = markup    # one value update instead of swapping children
+
+def build_toggle_tab(name):
+    """Build the toggle buttons of one tab (clicks are handled in JS)."""
+    data_type = TOGGLE_TABS[name][0]
+    toggle_options[name] = read_model_data(f"{SCRIPTS}/{toggle_data_file}", data_type)
+    apply_toggle_bits(name)
+
+def populate_toggle_tabs(data_file):
+    """Switch the data file and rebuild the tabs that were already built; the rest build on first open."""
+    global toggle_data_file
+    toggle_data_file = data_file
+    for name in TOGGLE_TABS:
+        TOGGLE_BITS[name] = 0
+        if name in toggle_options:
+            build_toggle_tab(name)
+
+# Tab switching is handled in JS (main-widgets.js); Python only builds a tab on first open
+def open_toggle_tab(tab_index):
+    """Build the toggle buttons of a tab the first time it is opened."""
+    name = TOGGLE_TAB_NAMES[tab_index]
+    if name not in toggle_options:
+        build_toggle_tab(name)
+
+def sync_toggle_bits(active_indices):
+    """Fold the per-tab active indices reported by the JS into TOGGLE_BITS."""
+    for name, indices in zip(TOGGLE_TAB_NAMES, active_indices):
+        if name in toggle_options:    # unbuilt tabs keep their loaded bits
+            TOGGLE_BITS[name] = sum(1 << i for i in set(indices))
+
+# Generate toggle buttons for the visible tab only
+build_toggle_tab('model')
 
 # Download tabs container
 download_tabs_container = factory.create_vbox(
@@ -211,18 +262,29 @@ additional_header = factory.create_header('Additionally')
 # latest_webui_widget, latest_extensions_widget, change_webui_widget, detailed_download_widget
 # are moved. check_custom_nodes_deps_widget will be in the drawer.
 
-controlnet_options = read_model_data(f"{SCRIPTS}/_models-data.py", 'cnet')
-commit_hash_widget = factory.create_text('Commit Hash:', '', 'Switching between branches or commits.')
+# Text fields: settings key -> create_text args
+def create_text_fields(fields):
+    """Create a text widget per field; returns {key: widget}."""
+    return {key: factory.create_text(*args) for key, args in fields.items()}
 
-civitai_token_widget = factory.create_text('CivitAI Token:', '', 'Enter your CivitAi API token.')
 # The expandable buttons for tokens are removed to match the new design.
-huggingface_token_widget = factory.create_text('HuggingFace Token:')
-ngrok_token_widget = factory.create_text('Ngrok Token:')
-zrok_token_widget = factory.create_text('Zrok Token:')
+TOKEN_FIELDS = {
+    'commit_hash': ('Commit Hash:', '', 'Switching between branches or commits.'),
+    'civitai_token': ('CivitAI Token:', '', 'Enter your CivitAi API token.'),
+    'huggingface_token': ('HuggingFace Token:',),
+    'zrok_token': ('Zrok Token:',),
+    'ngrok_token': ('Ngrok Token:',)
+}
+token_widgets = create_text_fields(TOKEN_FIELDS)
+commit_hash_widget = token_widgets['commit_hash']
+civitai_token_widget = token_widgets['civitai_token']
+huggingface_token_widget = token_widgets['huggingface_token']
+zrok_token_widget = token_widgets['zrok_token']
+ngrok_token_widget = token_widgets['ngrok_token']
 
 commandline_arguments_widget = factory.create_text('Arguments:', WEBUI_SELECTION['A1111'])
 
-accent_colors_options = ['scarysingle', 'blue', 'green', 'peach', 'pink', 'red', 'yellow']
+accent_colors_options = ('scarysingle', 'blue', 'green', 'peach', 'pink', 'red', 'yellow')
 theme_accent_widget = factory.create_dropdown(accent_colors_options, 'Theme Accent:', 'scarysingle',
                                               layout={'width': 'auto', 'margin': '0 0 0 8px'})    # margin-left
 
@@ -243,8 +305,7 @@ additional_widget_list = [
 # custom_download_header_popup removed as it's obsolete.
 
 empowerment_widget = factory.create_checkbox('Empowerment', False, class_names=['empowerment'])
-empowerment_output_widget = factory.create_textarea(
-'', '', """Use special tags. Portable analog of "File (txt)"
+EMPOWERMENT_PLACEHOLDER = """Use special tags. Portable analog of "File (txt)"
 Tags: model (ckpt), vae, lora, embed (emb), extension (ext), adetailer (ad), control (cnet), upscale (ups), clip, unet, vision (vis), encoder (enc), diffusion (diff), config (cfg)
 Short tags: start with '$' without a space -> $ckpt
 ------ Example ------
@@ -254,43 +315,46 @@ https://civitai.com/api/download/models/229782
 
 $ext
 https://github.com/hako-mikan/sd-webui-cd-tuner[CD-Tuner]
-""")
+"""
+empowerment_output_widget = factory.create_textarea(
+    '', '', EMPOWERMENT_PLACEHOLDER,
+    class_names=['empowerment-output', 'hidden']
+)
 
-Model_url_widget = factory.create_text('Model:')
-Vae_url_widget = factory.create_text('Vae:')
-LoRA_url_widget = factory.create_text('LoRa:')
-Embedding_url_widget = factory.create_text('Embedding:')
-Extensions_url_widget = factory.create_text('Extensions:')
-ADetailer_url_widget = factory.create_text('ADetailer:')
-custom_file_urls_widget = factory.create_text('File (txt):')
+URL_FIELDS = {
+    'Model_url': ('Model:',),
+    'Vae_url': ('Vae:',),
+    'LoRA_url': ('LoRa:',),
+    'Embedding_url': ('Embedding:',),
+    'Extensions_url': ('Extensions:',),
+    'ADetailer_url': ('ADetailer:',),
+    'custom_file_urls': ('File (txt):',)
+}
+url_widgets = create_text_fields(URL_FIELDS)
+Model_url_widget = url_widgets['Model_url']
+Vae_url_widget = url_widgets['Vae_url']
+LoRA_url_widget = url_widgets['LoRA_url']
+Embedding_url_widget = url_widgets['Embedding_url']
+Extensions_url_widget = url_widgets['Extensions_url']
+ADetailer_url_widget = url_widgets['ADetailer_url']
+custom_file_urls_widget = url_widgets['custom_file_urls']
 
 # --- Enhanced Save Button with Textured Text ---
 """Create enhanced save button with textured styling."""
-save_button_html = factory.create_html('''
-<button class="button button_save">
-    <span class="button-text">Save</span>
-</button>
-''')
+save_button_html = factory.create_html(SAVE_BUTTON_HTML)
 
 # ===================== CONSOLIDATED TOP BAR =====================
 """Create the new consolidated top bar with three sections."""
 
 # --- Utility Section ---
 TOOLTIPS = ("Unmount Google Drive storage", "Mount Google Drive storage")
-GD_status = js.read(SETTINGS_PATH, 'mountGDrive', False)
-gdrive_toggle_state = GD_status
+# gdrive_toggle_state is restored from settings by load_settings()
 
-gdrive_button_html = factory.create_html('<div class="utility-button" title="Google Drive">🔗</div>')
-export_button_html = factory.create_html('<div class="utility-button" title="Export">⬇</div>')
-import_button_html = factory.create_html('<div class="utility-button" title="Import">⬆</div>')
+# Title and buttons share one HTML widget; the JS looks the buttons up by title
+utility_buttons_html = factory.create_html(UTILITY_BUTTONS_HTML)
 
 utility_section = factory.create_hbox(
-    [
-        factory.create_html('<span class="section-title">Utils</span>'),
-        gdrive_button_html,
-        export_button_html,
-        import_button_html
-    ],
+    [utility_buttons_html],
     class_names=['control-section', 'utility-section']
 )
 
@@ -303,7 +367,7 @@ model_types_container = factory.create_hbox(
 )
 
 change_webui_widget = factory.create_dropdown(
-    list(WEBUI_SELECTION.keys()),
+    WEBUI_NAMES,
     description='', # No label
     value='A1111',
     class_names=['webui-select']
@@ -327,11 +391,12 @@ detailed_download_widget = factory.create_dropdown(
     value='off',
     class_names=['compact-select']
 )
-check_custom_nodes_deps_widget = factory.create_checkbox('Check Custom-Nodes Dependencies', True, class_names=['compact-toggle'])
+check_custom_nodes_deps_widget = factory.create_checkbox('Check Custom-Nodes Dependencies', True, class_names=['compact-toggle'],
+                                                         layout={'display': 'none'})    # shown for ComfyUI only
 
 settings_section = factory.create_hbox(
     [
-        factory.create_html('<span class="section-title">Settings</span>'),
+        factory.create_html(SETTINGS_TITLE_HTML),
         latest_webui_widget,
         latest_extensions_widget,
         detailed_download_widget
@@ -352,18 +417,17 @@ import_button = widgets.Button()
 # EXPORT
 def export_settings(button=None, filter_empty=False):
     try:
-        widgets_data = {}
-        for key in SETTINGS_KEYS:
-            value = globals()[f"{key}_widget"].value
-            if not filter_empty or (value not in [None, '', False]):
-                widgets_data[key] = value
+        widgets_data = {
+            key: widget.value for key, widget in SETTINGS_WIDGETS.items()
+            if not filter_empty or widget.value not in (None, '', False)
+        }
 
         settings_data = {
             'widgets': widgets_data,
             # 'mountGDrive': gdrive_toggle_state
         }
 
-        display(Javascript(f'downloadJson({json.dumps(settings_data)});'))
+        output.eval_js(f'downloadJson({json.dumps(settings_data)})', ignore_result=True)
         show_notification("Settings exported successfully!", "success")
     except Exception as e:
         show_notification(f"Export failed: {str(e)}", "error")
@@ -371,23 +435,39 @@ def export_settings(button=None, filter_empty=False):
 # IMPORT
 
 def import_settings(button=None):
-    display(Javascript('openFilePicker();'))
+    output.eval_js('openFilePicker()', ignore_result=True)
 
 # APPLY SETTINGS
+OBSERVED_SETTINGS = frozenset({'XL_models', 'change_webui', 'empowerment'})   # keys with change callbacks
+
+def apply_setting(key, value):
+    """Assign an imported value to its widget; returns True if the key was applied."""
+    widget = SETTINGS_WIDGETS.get(key)
+    if widget is None:
+        return False
+    if widget.value == value:    # unchanged -> don't fire observers
+        return True
+    try:
+        widget.value = value
+        return True
+    except:
+        return False
+
 def apply_imported_settings(data):
     try:
         success_count = 0
         total_count = 0
 
         if 'widgets' in data:
-            for key, value in data['widgets'].items():
-                total_count += 1
-                if key in SETTINGS_KEYS and f"{key}_widget" in globals():
-                    try:
-                        globals()[f"{key}_widget"].value = value
-                        success_count += 1
-                    except:
-                        pass
+            imported = data['widgets']
+            # Observed keys go first, so the values their callbacks derive (WebUI args,
+            # inpainting) are then overwritten by the imported ones rather than the reverse
+            observed = [key for key in imported if key in OBSERVED_SETTINGS]
+            plain = [key for key in imported if key not in OBSERVED_SETTINGS]
+
+            success_count += sum(apply_setting(key, imported[key]) for key in observed)
+            success_count += sum(apply_setting(key, imported[key]) for key in plain)
+            total_count = len(imported)
 
         if 'mountGDrive' in data:
             global gdrive_toggle_state
@@ -410,26 +490,28 @@ def apply_imported_settings(data):
 """Create widget-popup displaying status of Export/Import settings."""
 notification_popup = factory.create_html('', class_names=['notification-popup', 'hidden'])
 
-def show_notification(message, message_type='info'):
-    icon_map = {
-        'success':  '✅',
-        'error':    '❌',
-        'info':     '💡',
-        'warning':  '⚠️'
-    }
-    icon = icon_map.get(message_type, 'info')
-
-    notification_popup.value = f'''
-    <div class="notification {message_type}">
+NOTIFICATION_ICONS = {
+    'success':  '✅',
+    'error':    '❌',
+    'info':     '💡',
+    'warning':  '⚠️'
+}
+NOTIFICATION_TEMPLATE = '''
+    <div class="notification {type}">
         <span class="notification-icon">{icon}</span>
         <span class="notification-text">{message}</span>
     </div>
     '''
 
+def show_notification(message, message_type='info'):
+    icon = NOTIFICATION_ICONS.get(message_type, NOTIFICATION_ICONS['info'])
+    notification_popup.value = NOTIFICATION_TEMPLATE.format(type=message_type, icon=icon, message=message)
+
     # Trigger re-show | Anxety-Tip: JS Script removes class only from DOM but not from widgets?!
-    notification_popup.remove_class('visible')
-    notification_popup.remove_class('hidden')
-    notification_popup.add_class('visible')
+    # A stale 'visible' has to be synced away first; showing is then a single class update
+    if 'visible' in notification_popup._dom_classes:
+        factory.set_classes(notification_popup, remove=['visible'])
+    factory.set_classes(notification_popup, add=['visible'], remove=['hidden'])
 
     # Auto-hide PopUp After 2.5s
     display(Javascript("hideNotification(delay = 2500);"))
@@ -442,8 +524,8 @@ so it can be called from JavaScript via google.colab.kernel.invokeFunction(...)
 output.register_callback('importSettingsFromJS', apply_imported_settings)
 output.register_callback('showNotificationFromJS', show_notification)
 
-export_button.on_click(export_settings)
-import_button.on_click(import_settings)
+factory.connect_buttons([export_button], export_settings)
+factory.connect_buttons([import_button], import_settings)
 
 
 # =================== DISPLAY / SETTINGS ===================
@@ -479,9 +561,9 @@ custom_download_content = factory.create_vbox(
     class_names=['bottom-tab-content', 'active']
 )
 
-# Advanced Settings Tab
+# Advanced Settings Tab (filled the first time it is opened)
 advanced_settings_content = factory.create_vbox(
-    additional_widget_list,
+    [],
     class_names=['bottom-tab-content']
 )
 
@@ -493,22 +575,52 @@ bottom_tab_container = factory.create_hbox(
     class_names=['bottom-tab-container']
 )
 
-# Drawer Container
-drawer_container = factory.create_vbox(
-    [
-        bottom_tab_container,
-        custom_download_content,
-        advanced_settings_content
-    ],
-    class_names=['bottom-sections', 'hidden']
-)
+BOTTOM_TABS = ((bottom_tab_custom, custom_download_content), (bottom_tab_advanced, advanced_settings_content))
+
+def switch_bottom_tab(button):
+    """Activate the clicked drawer tab, filling Advanced Settings on first open."""
+    if button is bottom_tab_advanced and not advanced_settings_content.children:
+        advanced_settings_content.children = additional_widget_list
+    for tab, content in BOTTOM_TABS:
+        if tab is button:
+            tab.add_class('active')
+            content.add_class('active')
+        else:
+            tab.remove_class('active')
+            content.remove_class('active')
+
+factory.connect_buttons([tab for tab, _ in BOTTOM_TABS], switch_bottom_tab)
+
+# Drawer Container (its sections are only rendered once the drawer is first expanded)
+DRAWER_SECTIONS = (bottom_tab_container, custom_download_content, advanced_settings_content)
+drawer_container = factory.create_vbox([], class_names=['bottom-sections', 'hidden'])
+
+def toggle_drawer(button):
+    """Expand or collapse the advanced drawer, building its sections on first expand."""
+    if not drawer_container.children:
+        drawer_container.children = DRAWER_SECTIONS
+
+    expanded = 'expanded' not in button._dom_classes
+    with button.hold_sync(), drawer_container.hold_sync():    # one state message per widget
+        if expanded:
+            button.add_class('expanded')
+            drawer_container.remove_class('hidden')
+            drawer_container.add_class('shown')
+        else:
+            button.remove_class('expanded')
+            drawer_container.remove_class('shown')
+            drawer_container.add_class('hidden')
+        button.description = 'Hide Advanced Options' if expanded else 'Advanced Options'
+        button.icon = 'chevron-up' if expanded else 'chevron-down'
+
+factory.connect_buttons([drawer_toggle_button], toggle_drawer)
 
 # Enhanced layout structure - COMPLETELY FIXED
 CONTAINERS_WIDTH = '1080px'
 
 # Redesigned download selection section
 model_download_section = factory.create_vbox([
-    factory.create_header('Model Selection'),
+    model_header,
     download_tabs_container
 ], class_names=['container', 'model-selection'])
 
@@ -528,211 +640,172 @@ sideContainer = factory.create_vbox(
     class_names=['sideContainer']
 )
 
+# The utility buttons (Drive / Export / Import) rely on google.colab; CSS hides them elsewhere
 mainContainer = factory.create_hbox(
     [widgetContainer, sideContainer],
-    class_names=['mainContainer'],
+    class_names=['mainContainer'] if ENV_NAME == 'Google Colab' else ['mainContainer', 'non-colab'],
     layout={'align_items': 'flex-start'}
 )
 
-factory.display(mainContainer)
-
 
 # ==================== CALLBACK FUNCTION ===================
 
-# Initialize visibility | hidden
-if hasattr(check_custom_nodes_deps_widget, 'layout') and hasattr(check_custom_nodes_deps_widget.layout, 'display'):
-    check_custom_nodes_deps_widget.layout.display = 'none'
-empowerment_output_widget.add_class('empowerment-output')
-empowerment_output_widget.add_class('hidden')
-
 # Callback functions for XL options
+_last_xl_state = False    # the tabs are first built from _models-data.py
+
 def update_XL_options(change, widget):
-    is_xl = change['new']
+    if change['new'] == change['old']:
+        return
+    apply_XL_options()
+
+def apply_XL_options():
+    global _last_xl_state
+    is_xl = XL_models_widget.value
+    if is_xl == _last_xl_state:
+        return
+    _last_xl_state = is_xl
     
     data_file = '_xl-models-data.py' if is_xl else '_models-data.py'
-    
-    # Update toggle buttons with new options
-    new_model_options = read_model_data(f"{SCRIPTS}/{data_file}", 'model')
-    new_vae_options = read_model_data(f"{SCRIPTS}/{data_file}", 'vae')
-    new_controlnet_options = read_model_data(f"{SCRIPTS}/{data_file}", 'cnet')
-    new_lora_options = read_model_data(f"{SCRIPTS}/{data_file}", 'lora')
-    
-    # Clear existing toggle buttons
-    tab_content_models.children = []
-    tab_content_vae.children = []
-    tab_content_controlnet.children = []
-    tab_content_lora.children = []
-    
-    # Create new toggle buttons with updated options
-    global model_toggle_buttons, vae_toggle_buttons, controlnet_toggle_buttons, lora_toggle_buttons
-    model_toggle_buttons = create_toggle_buttons('model', new_model_options)
-    vae_toggle_buttons = create_toggle_buttons('vae', new_vae_options)
-    controlnet_toggle_buttons = create_toggle_buttons('controlnet', new_controlnet_options)
-    lora_toggle_buttons = create_toggle_buttons('lora', new_lora_options)
-    
-    # Add new toggle buttons to tab contents
-    tab_content_models.children = model_toggle_buttons
-    tab_content_vae.children = vae_toggle_buttons
-    tab_content_controlnet.children = controlnet_toggle_buttons
-    tab_content_lora.children = lora_toggle_buttons
-    
-    # Connect new toggle buttons to toggle function
-    for button in model_toggle_buttons:
-        button.on_click(toggle_button)
-    for button in vae_toggle_buttons:
-        button.on_click(toggle_button)
-    for button in controlnet_toggle_buttons:
-        button.on_click(toggle_button)
-    for button in lora_toggle_buttons:
-        button.on_click(toggle_button)
-    
-    # Disable/enable inpainting checkbox based on SDXL state
-    if is_xl:
-        inpainting_model_widget.add_class('_disable')
-        inpainting_model_widget.value = False
-    else:
-        inpainting_model_widget.remove_class('_disable')
+
+    # Hold syncing so the tab rebuilds and the inpainting update reach the frontend as one
+    # message per widget (the tab HTML widgets are where the markup actually changes)
+    with ExitStack() as stack:
+        for wg in (*toggle_html.values(), *(content for _, content in TOGGLE_TABS.values()),
+                   inpainting_model_widget):
+            stack.enter_context(wg.hold_sync())
+
+        # Rebuild toggle buttons with the new options (one children assignment per tab)
+        populate_toggle_tabs(data_file)
+
+        # Disable/enable inpainting checkbox based on SDXL state
+        is_disabled = '_disable' in inpainting_model_widget._dom_classes
+        if is_xl:
+            if not is_disabled:
+                inpainting_model_widget.add_class('_disable')
+            inpainting_model_widget.value = False
+        elif is_disabled:
+            inpainting_model_widget.remove_class('_disable')
 
 # Callback functions for updating widgets
+WEBUI_DEPENDENT_WIDGETS = (
+    commandline_arguments_widget, latest_extensions_widget,
+    check_custom_nodes_deps_widget, theme_accent_widget, Extensions_url_widget
+)
+WEBUI_ARGS = {webui: (args, webui == 'ComfyUI') for webui, args in WEBUI_SELECTION.items()}   # -> (args, is_comfy)
+
 def update_change_webui(change, widget):
-    webui = change['new']
-    commandline_arguments_widget.value = WEBUI_SELECTION.get(webui, '')
+    if change['new'] == change['old']:
+        return
+    args, is_comfy = WEBUI_ARGS.get(change['new'], ('', False))
+
+    # Hold syncing so each widget (and layout) sends its changes below as one state message
+    with ExitStack() as stack:
+        for wg in WEBUI_DEPENDENT_WIDGETS:
+            stack.enter_context(wg.hold_sync())
+            stack.enter_context(wg.layout.hold_sync())
 
-    is_comfy = webui == 'ComfyUI'
+        if commandline_arguments_widget.value != args:
+            commandline_arguments_widget.value = args
 
-    if hasattr(latest_extensions_widget, 'layout') and hasattr(latest_extensions_widget.layout, 'display'):
         latest_extensions_widget.layout.display = 'none' if is_comfy else ''
-    latest_extensions_widget.value = not is_comfy
-    if hasattr(check_custom_nodes_deps_widget, 'layout') and hasattr(check_custom_nodes_deps_widget.layout, 'display'):
+        latest_extensions_widget.value = not is_comfy
         check_custom_nodes_deps_widget.layout.display = '' if is_comfy else 'none'
-    if hasattr(theme_accent_widget, 'layout') and hasattr(theme_accent_widget.layout, 'display'):
         theme_accent_widget.layout.display = 'none' if is_comfy else ''
-    Extensions_url_widget.description = 'Custom Nodes:' if is_comfy else 'Extensions:'
+        Extensions_url_widget.description = 'Custom Nodes:' if is_comfy else 'Extensions:'
 
 # Callback functions for Empowerment
+CUSTOM_DL_WIDGETS = (
+    Model_url_widget,
+    Vae_url_widget,
+    LoRA_url_widget,
+    Embedding_url_widget,
+    Extensions_url_widget,
+    ADetailer_url_widget
+)
+
 def update_empowerment(change, widget):
+    if change['new'] == change['old']:
+        return
     selected_emp = change['new']
 
-    customDL_widgets = [
-        Model_url_widget,
-        Vae_url_widget,
-        LoRA_url_widget,
-        Embedding_url_widget,
-        Extensions_url_widget,
-        ADetailer_url_widget
-    ]
-    for widget in customDL_widgets:    # For switching animation
-        widget.add_class('empowerment-text-field')
-
     # idk why, but that's the way it's supposed to be >_<'
+    # ('empowerment-text-field' is for the switching animation; one class update per widget)
+    for wg in CUSTOM_DL_WIDGETS:
+        if selected_emp:
+            factory.set_classes(wg, add=['empowerment-text-field', 'hidden'])
+        else:
+            factory.set_classes(wg, add=['empowerment-text-field'], remove=['hidden'])
+
     if selected_emp:
-        for wg in customDL_widgets:
-            wg.add_class('hidden')
         empowerment_output_widget.remove_class('hidden')
     else:
-        for wg in customDL_widgets:
-            wg.remove_class('hidden')
         empowerment_output_widget.add_class('hidden')
 
 # Connecting widgets
-factory.connect_widgets([(change_webui_widget, 'value')], update_change_webui)
-factory.connect_widgets([(XL_models_widget, 'value')], update_XL_options)
-factory.connect_widgets([(empowerment_widget, 'value')], update_empowerment)
+factory.connect_many([
+    (change_webui_widget, 'value', update_change_webui),
+    (XL_models_widget, 'value', update_XL_options),
+    (empowerment_widget, 'value', update_empowerment)
+])
 
 
 # ================ Load / Save - Settings V4 ===============
 
-SETTINGS_KEYS = [
+SETTINGS_KEYS = (
       'XL_models', 'inpainting_model',
       # Additional
       'latest_webui', 'latest_extensions', 'check_custom_nodes_deps', 'change_webui', 'detailed_download',
-      'commit_hash',
-      'civitai_token', 'huggingface_token', 'zrok_token', 'ngrok_token', 'commandline_arguments', 'theme_accent',
+      *TOKEN_FIELDS, 'commandline_arguments', 'theme_accent',
       # CustomDL
       'empowerment', 'empowerment_output',
-      'Model_url', 'Vae_url', 'LoRA_url', 'Embedding_url', 'Extensions_url', 'ADetailer_url',
-      'custom_file_urls'
-]
-
-def save_toggle_button_states():
-    """Save the active states of toggle buttons."""
-    toggle_states = {}
-    
-    # Save model toggle states
-    for i, button in enumerate(model_toggle_buttons):
-        if hasattr(button, '_is_active'):
-            toggle_states[f'model_toggle_{i}'] = button._is_active
-    
-    # Save vae toggle states
-    for i, button in enumerate(vae_toggle_buttons):
-        if hasattr(button, '_is_active'):
-            toggle_states[f'vae_toggle_{i}'] = button._is_active
-            
-    # Save lora toggle states
-    for i, button in enumerate(lora_toggle_buttons):
-        if hasattr(button, '_is_active'):
-            toggle_states[f'lora_toggle_{i}'] = button._is_active
-            
-    # Save controlnet toggle states
-    for i, button in enumerate(controlnet_toggle_buttons):
-        if hasattr(button, '_is_active'):
-            toggle_states[f'controlnet_toggle_{i}'] = button._is_active
-    
-    js.save(SETTINGS_PATH, 'TOGGLE_STATES', toggle_states)
+      *URL_FIELDS
+)
+SETTINGS_WIDGETS = {key: globals()[f"{key}_widget"] for key in SETTINGS_KEYS}   # resolved once
+
+def legacy_toggle_bits(toggle_states, name):
+    """Fold the old per-button `{tab}_toggle_{i}: bool` states of one tab into a bitmask."""
+    prefix = f'{name}_toggle_'
+    bits = 0
+    for key, active in toggle_states.items():
+        index = key[len(prefix):]
+        if active is True and key.startswith(prefix) and index.isdigit():
+            bits |= 1 << int(index)
+    return bits
 
 def load_toggle_button_states():
     """Load the active states of toggle buttons."""
-    if not js.key_exists(SETTINGS_PATH, 'TOGGLE_STATES'):
+    toggle_states = read_settings('TOGGLE_STATES')
+    if not isinstance(toggle_states, dict):
         return
-        
-    toggle_states = js.read(SETTINGS_PATH, 'TOGGLE_STATES')
-    
-    # Load model toggle states
-    for i, button in enumerate(model_toggle_buttons):
-        state_key = f'model_toggle_{i}'
-        if state_key in toggle_states and toggle_states[state_key]:
-            button._is_active = True
-            button.add_class('active')
-    
-    # Load vae toggle states
-    for i, button in enumerate(vae_toggle_buttons):
-        state_key = f'vae_toggle_{i}'
-        if state_key in toggle_states and toggle_states[state_key]:
-            button._is_active = True
-            button.add_class('active')
-            
-    # Load lora toggle states
-    for i, button in enumerate(lora_toggle_buttons):
-        state_key = f'lora_toggle_{i}'
-        if state_key in toggle_states and toggle_states[state_key]:
-            button._is_active = True
-            button.add_class('active')
-            
-    # Load controlnet toggle states
-    for i, button in enumerate(controlnet_toggle_buttons):
-        state_key = f'controlnet_toggle_{i}'
-        if state_key in toggle_states and toggle_states[state_key]:
-            button._is_active = True
-            button.add_class('active')
 
-def save_settings():
-    """Save widget values to settings."""
-    widgets_values = {key: globals()[f"{key}_widget"].value for key in SETTINGS_KEYS}
-    js.save(SETTINGS_PATH, 'WIDGETS', widgets_values)
-    js.save(SETTINGS_PATH, 'mountGDrive', True if gdrive_toggle_state else False)  # Save Status GDrive-btn
+    for name in TOGGLE_TABS:
+        bits = toggle_states.get(name)
+        if not isinstance(bits, int):    # settings saved before bitmasks: `{tab}_toggle_{i}` flags
+            bits = legacy_toggle_bits(toggle_states, name)
+        TOGGLE_BITS[name] = bits
+        if name in toggle_options:    # unbuilt tabs apply their bits when first opened
+            apply_toggle_bits(name)
 
-    update_current_webui(change_webui_widget.value)  # Update Selected WebUI in settings.json
+def save_settings():
+    """Save widget values, toggle states (one bitmask per tab) and the WebUI in a single write."""
+    update_current_webui(change_webui_widget.value, {    # Update Selected WebUI in settings.json
+        'TOGGLE_STATES': {name: bits for name, bits in TOGGLE_BITS.items() if bits},    # missing -> 0
+        'WIDGETS': {key: widget.value for key, widget in SETTINGS_WIDGETS.items()},
+        'mountGDrive': bool(gdrive_toggle_state)    # Save Status GDrive-btn
+    })
+    drop_settings_cache()
 
 def load_settings():
     """Load widget values from settings."""
-    if js.key_exists(SETTINGS_PATH, 'WIDGETS'):
-        widget_data = js.read(SETTINGS_PATH, 'WIDGETS')
-        for key in SETTINGS_KEYS:
-            if key in widget_data:
-                globals()[f"{key}_widget"].value = widget_data.get(key, '')
+    widget_data = read_settings('WIDGETS')
+    if widget_data is not None:
+        for key, widget in SETTINGS_WIDGETS.items():
+            # Only assign real changes, so loaded defaults don't fire observers
+            if key in widget_data and widget.value != widget_data[key]:
+                widget.value = widget_data[key]
 
     # Load Status GDrive-btn
-    GD_status = js.read(SETTINGS_PATH, 'mountGDrive', False)
+    GD_status = read_settings('mountGDrive', False)
     global gdrive_toggle_state
     gdrive_toggle_state = (GD_status == True)
     if gdrive_toggle_state:
@@ -740,20 +813,53 @@ def load_settings():
     else:
         GDrive_button.remove_class('active')
 
-def save_data(button=None):
-    """Handle save button click."""
-    # Save toggle button states before saving settings
-    save_toggle_button_states()
+CLOSE_FALLBACK_DELAY = 2    # seconds; the fade-out itself takes 0.8s
+_pending_close = None       # handle of the fallback close, if one is scheduled
+_widgets_closed = False
+
+def save_data(toggle_states=None):
+    """Handle save button click; `toggle_states` are the active indices collected in JS."""
+    if toggle_states is not None:
+        sync_toggle_bits(toggle_states)
+
     save_settings()
     
-    # Close the main container (this will close all child widgets)
-    factory.close([mainContainer], class_names=['hide'], delay=0.8)
+    # Start the CSS fade-out; the JS closes the main container (and all child widgets) on
+    # `animationend` via close_widgets, the kernel-loop timer is only a fallback if that never arrives
+    global _pending_close
+    factory.add_classes(mainContainer, ['hide'])
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = None
+    if loop is None or not loop.is_running():    # no kernel loop to defer to
+        close_widgets()
+        return
+    if _pending_close is None:
+        _pending_close = loop.call_later(CLOSE_FALLBACK_DELAY, close_widgets)
+
+def close_widgets():
+    """Close the main container once its fade-out animation has ended (called from JS), only once."""
+    global _pending_close, _widgets_closed
+    if _pending_close is not None:
+        _pending_close.cancel()
+        _pending_close = None
+    if _widgets_closed:
+        return
+    _widgets_closed = True
+    mainContainer.close()
 
 # Obsolete JavaScript and callback registration removed.
 # All JS is now in main-widgets.js and loaded via factory.load_js()
 # The save button will be handled by a new callback.
 
 output.register_callback('notebook.save_data_from_js', save_data)
+output.register_callback('notebook.close_widgets', close_widgets)
+output.register_callback('notebook.open_toggle_tab', open_toggle_tab)
 
 load_settings()
-load_toggle_button_states()
\ No newline at end of file
+load_toggle_button_states()
+
+# Display last: the views render once with the loaded settings, and every callback the
+# JS can invoke is already registered
+factory.display(mainContainer)
\ No newline at end of file
@@ -109,24 +109,22 @@ def _install_deps() -> bool:
 def _get_start_timer() -> int:
     """Get start timer from settings or return current time minus 5 seconds."""
     try:
-        if SETTINGS_PATH.exists():
-            settings = json.loads(SETTINGS_PATH.read_text())
-            return settings.get("ENVIRONMENT", {}).get("start_timer", int(time.time() - 5))
+        settings = json.loads(SETTINGS_PATH.read_text())    # a missing file raises OSError
+        return settings.get("ENVIRONMENT", {}).get("start_timer", int(time.time() - 5))
     except (json.JSONDecodeError, OSError):
         pass
     return int(time.time() - 5)
 
 def save_env_to_json(data: dict, filepath: Path) -> None:
     """Save environment data to JSON file, merging with existing content."""
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-
-    # Load existing data if file exists
+    # Load existing data if file exists (one read attempt, no separate exists() check)
     existing_data = {}
-    if filepath.exists():
-        try:
-            existing_data = json.loads(filepath.read_text())
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        existing_data = json.loads(filepath.read_text())
+    except FileNotFoundError:
+        filepath.parent.mkdir(parents=True, exist_ok=True)    # only needed for a new file
+    except (json.JSONDecodeError, OSError):
+        pass
 
     # Merge new data with existing
     merged_data = {**existing_data, **data}
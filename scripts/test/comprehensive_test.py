@@ -6,11 +6,13 @@ import importlib.util
 
 # --- Mock google.colab ---
 # This must be done before any other imports that might try to import google.colab
-google_colab = MagicMock()
-google_colab.output = MagicMock()
-google_colab.output.register_callback = MagicMock()
-sys.modules['google'] = MagicMock()
-sys.modules['google.colab'] = google_colab
+# (only when it isn't already loaded, e.g. by a real Colab runtime or google_colab_mock)
+if 'google.colab' not in sys.modules:
+    google_colab = MagicMock()
+    google_colab.output = MagicMock()
+    google_colab.output.register_callback = MagicMock()
+    sys.modules['google'] = MagicMock()
+    sys.modules['google.colab'] = google_colab
 
 
 # --- Add project directories to Python path ---